@@ -4,18 +4,37 @@ This module initializes the FastAPI application, sets up middleware,
 configures logging, initializes the database, and registers API routers.
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+import json
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from app.utils.config import get_settings
-from app.utils.database import init_database, close_database, health_check_database
+from app.utils.database import (
+    init_database,
+    open_database_pool,
+    close_database,
+    health_check_database,
+)
 from app.utils.logger import setup_logger, get_logger
-from app.utils.middleware import RequestSizeLimitMiddleware, RequestIDMiddleware
+from app.utils.middleware import (
+    RequestSizeLimitMiddleware,
+    RequestIDMiddleware,
+    StreamingAwareGZipMiddleware
+)
+from app.services.health import init_health_client, close_health_client
+from app.services.batcher import close_request_batcher
+from app.services.router import (
+    init_backend_client,
+    close_backend_client,
+    start_success_flusher,
+    stop_success_flusher
+)
 from app.services.health_checker import start_health_checker, stop_health_checker
 
 # Initialize settings and logger
@@ -31,13 +50,57 @@ logger = setup_logger(
     enable_file=settings.enable_file_logging
 )
 
+# Cached result of the /health database probe, shared by concurrent callers
+_health_cache = {"ts": 0.0, "ok": False}
+_health_lock = asyncio.Lock()
+
+
+class _StaticJSONResponse(Response):
+    """JSON response that can be built once and returned for every request.
+    
+    Starlette sends ``raw_headers`` by reference and middleware (CORS, GZip)
+    edits the outgoing header list in place, so each send gets its own copy
+    of the headers to keep the shared instance unchanged.
+    """
+    
+    media_type = "application/json"
+    
+    async def __call__(self, scope, receive, send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": list(self.raw_headers),
+        })
+        await send({"type": "http.response.body", "body": self.body})
+
+
+def _build_health_response(db_healthy: bool) -> _StaticJSONResponse:
+    """Build the /health response for the given database state."""
+    body = json.dumps({
+        "status": "healthy" if db_healthy else "unhealthy",
+        "service": settings.app_name,
+        "version": settings.app_version,
+        "database": "healthy" if db_healthy else "unhealthy",
+    }).encode("utf-8")
+    return _StaticJSONResponse(content=body, status_code=200 if db_healthy else 503)
+
+
+# Settings are immutable for the process lifetime, so the possible probe
+# responses are built once at import time and reused for every request
+_HEALTHY_RESPONSE = _build_health_response(True)
+_UNHEALTHY_RESPONSE = _build_health_response(False)
+_LIVENESS_RESPONSE = _StaticJSONResponse(
+    content=json.dumps({"status": "ok"}).encode("utf-8"),
+    status_code=200
+)
+
 
 @asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator:
-    """Application lifespan manager.
+async def database_lifespan(app: FastAPI) -> AsyncGenerator:
+    """Initialize the database on startup and close it on shutdown.
     
-    This function handles startup and shutdown events for the application.
-    It initializes resources on startup and cleans them up on shutdown.
+    The startup health probe also seeds the /health cache so the first
+    readiness probes after boot do not each hit the database.
     
     Args:
         app: FastAPI application instance
@@ -45,61 +108,184 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     Yields:
         None
     """
-    # Startup
-    logger.info("=" * 60)
-    logger.info(f"Starting {settings.app_name} v{settings.app_version}")
-    logger.info("=" * 60)
+    logger.info("Initializing database...")
+    await init_database()
+    logger.info("Database initialized successfully")
+    await open_database_pool()
     
-    logger.info(f"Host: {settings.host}:{settings.port}")
-    logger.info(f"Debug mode: {settings.debug}")
-    logger.info(f"Log level: {settings.log_level}")
-    logger.info(f"Database: {settings.database_url}")
+    # Verify database health
+    db_healthy = await health_check_database()
+    _health_cache["ok"] = db_healthy
+    _health_cache["ts"] = asyncio.get_running_loop().time()
+    if not db_healthy:
+        logger.error("Database health check failed!")
+    else:
+        logger.info("Database health check passed")
     
     try:
-        # Initialize database
-        logger.info("Initializing database...")
-        await init_database()
-        logger.info("Database initialized successfully")
-        
-        # Verify database health
-        db_healthy = await health_check_database()
-        if not db_healthy:
-            logger.error("Database health check failed!")
-        else:
-            logger.info("Database health check passed")
-        
-        # Start background health checker
-        logger.info("Starting background health checker...")
-        await start_health_checker()
-        logger.info("Background health checker started")
-        
-        logger.info("Application startup complete")
-        logger.info("=" * 60)
-        
-    except Exception as error:
-        logger.critical(f"Failed to start application: {error}", exc_info=True)
-        raise
+        yield
+    finally:
+        try:
+            # Shield so a cancelled shutdown cannot leave connections open
+            await asyncio.shield(close_database())
+            logger.info("Database connections closed")
+        except Exception as error:
+            logger.error("Error closing database: %s", error, exc_info=True)
+
+
+@asynccontextmanager
+async def success_flusher_lifespan(app: FastAPI) -> AsyncGenerator:
+    """Run the router's bookkeeping writes in the background.
     
-    yield
+    Successful-request timestamps and server failure reports are written
+    off the request path while this is active. Entered after the database
+    lifespan, so pending writes finish before the connection pool closes.
     
-    # Shutdown
-    logger.info("=" * 60)
-    logger.info("Shutting down application...")
-    logger.info("=" * 60)
+    Args:
+        app: FastAPI application instance
+    
+    Yields:
+        None
+    """
+    await start_success_flusher()
     
     try:
-        # Stop background health checker
-        await stop_health_checker()
-        logger.info("Health checker stopped")
-        
-        # Close database connections
-        await close_database()
-        logger.info("Database connections closed")
+        yield
+    finally:
+        try:
+            await asyncio.shield(stop_success_flusher())
+        except Exception as error:
+            logger.error("Error stopping success flusher: %s", error, exc_info=True)
+
+
+@asynccontextmanager
+async def http_client_lifespan(app: FastAPI) -> AsyncGenerator:
+    """Open the shared outbound HTTP clients and close them on shutdown.
+    
+    Args:
+        app: FastAPI application instance
+    
+    Yields:
+        None
+    """
+    await init_health_client()
+    await init_backend_client()
+    
+    try:
+        yield
+    finally:
+        try:
+            await asyncio.shield(
+                asyncio.gather(close_health_client(), close_backend_client())
+            )
+        except Exception as error:
+            logger.error("Error closing HTTP clients: %s", error, exc_info=True)
+
+
+@asynccontextmanager
+async def health_checker_lifespan(app: FastAPI) -> AsyncGenerator:
+    """Run the background health checker for the lifetime of the application.
+    
+    Args:
+        app: FastAPI application instance
+    
+    Yields:
+        None
+    """
+    logger.info("Starting background health checker...")
+    await start_health_checker()
+    logger.info("Background health checker started")
+    
+    try:
+        yield
+    finally:
+        try:
+            # Shield so a cancelled shutdown still stops the background task
+            await asyncio.shield(stop_health_checker())
+            logger.info("Health checker stopped")
+        except Exception as error:
+            logger.error("Error stopping health checker: %s", error, exc_info=True)
+
+
+@asynccontextmanager
+async def request_batcher_lifespan(app: FastAPI) -> AsyncGenerator:
+    """Stop the request batcher on shutdown.
+    
+    The batcher starts lazily on the first batched request, so there is
+    nothing to do on startup.
+    
+    Args:
+        app: FastAPI application instance
+    
+    Yields:
+        None
+    """
+    try:
+        yield
+    finally:
+        try:
+            await asyncio.shield(close_request_batcher())
+        except Exception as error:
+            logger.error("Error stopping request batcher: %s", error, exc_info=True)
+
+
+# Lifespans entered in order on startup and exited in reverse on shutdown.
+# Mounted sub-applications can append their own lifespan here.
+LIFESPANS = [
+    database_lifespan,
+    success_flusher_lifespan,
+    http_client_lifespan,
+    health_checker_lifespan,
+    request_batcher_lifespan,
+]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator:
+    """Application lifespan manager.
+    
+    This function handles startup and shutdown events for the application
+    by composing the lifespans in LIFESPANS. Resources are initialized in
+    order on startup and cleaned up in reverse order on shutdown.
+    
+    Args:
+        app: FastAPI application instance
+    
+    Yields:
+        None
+    """
+    # Startup
+    logger.info(
+        "%s\nStarting %s v%s\n%s\n"
+        "  Host: %s:%s\n"
+        "  Debug mode: %s\n"
+        "  Log level: %s\n"
+        "  Database: %s",
+        "=" * 60, settings.app_name, settings.app_version, "=" * 60,
+        settings.host, settings.port,
+        settings.debug,
+        settings.log_level,
+        settings.database_url
+    )
+    
+    async with AsyncExitStack() as stack:
+        try:
+            for component_lifespan in LIFESPANS:
+                await stack.enter_async_context(component_lifespan(app))
+            
+            logger.info("Application startup complete")
+            logger.info("=" * 60)
+            
+        except Exception as error:
+            logger.critical("Failed to start application: %s", error, exc_info=True)
+            raise
         
-        logger.info("Application shutdown complete")
+        yield
         
-    except Exception as error:
-        logger.error(f"Error during shutdown: {error}", exc_info=True)
+        # Shutdown
+        logger.info("%s\nShutting down application...\n%s", "=" * 60, "=" * 60)
+    
+    logger.info("Application shutdown complete")
 
 
 # Create FastAPI application
@@ -113,6 +299,7 @@ app = FastAPI(
     ),
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -130,6 +317,11 @@ if settings.cors_enabled:
     )
     logger.info("CORS middleware enabled")
 
+# Response compression for large JSON payloads (server listings, stats).
+# Bodies under 1 KiB (e.g. /health) and SSE streams are left uncompressed.
+app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1024)
+logger.info("GZip middleware enabled")
+
 # Request ID middleware for logging correlation
 app.add_middleware(RequestIDMiddleware)
 logger.info("Request ID middleware enabled")
@@ -142,7 +334,58 @@ app.add_middleware(
 logger.info(f"Request size limit middleware enabled (max: {settings.max_request_body_size} bytes)")
 
 
-# Health check endpoint
+async def get_cached_database_health() -> bool:
+    """Return the database health, probing at most once per TTL window.
+    
+    Concurrent callers that arrive while a probe is in flight wait on the
+    same lock and reuse its result instead of issuing their own query.
+    
+    Returns:
+        True if the database is healthy, False otherwise
+    """
+    now = asyncio.get_running_loop().time()
+    if now - _health_cache["ts"] < settings.health_cache_ttl_seconds:
+        return _health_cache["ok"]
+    
+    async with _health_lock:
+        # Another caller may have refreshed the cache while we waited
+        now = asyncio.get_running_loop().time()
+        if now - _health_cache["ts"] < settings.health_cache_ttl_seconds:
+            return _health_cache["ok"]
+        
+        _health_cache["ok"] = await health_check_database()
+        _health_cache["ts"] = asyncio.get_running_loop().time()
+        return _health_cache["ok"]
+
+
+# Liveness probe endpoint
+@app.get(
+    "/healthz",
+    tags=["System"],
+    summary="Gateway liveness probe",
+    description="Check that the gateway process is alive (performs no I/O)",
+    response_description="Liveness status of the gateway"
+)
+async def liveness_check() -> Response:
+    """Gateway liveness endpoint.
+    
+    Intended for a Kubernetes livenessProbe. It never touches the database,
+    so a database outage does not cause healthy processes to be restarted.
+    
+    Returns:
+        JSON response with status "ok"
+    """
+    return _LIVENESS_RESPONSE
+
+
+# Readiness / health check endpoint
+@app.get(
+    "/readyz",
+    tags=["System"],
+    summary="Gateway readiness probe",
+    description="Check if the gateway is ready to serve traffic (database reachable)",
+    response_description="Health status of the gateway"
+)
 @app.get(
     "/health",
     tags=["System"],
@@ -150,32 +393,23 @@ logger.info(f"Request size limit middleware enabled (max: {settings.max_request_
     description="Check if the gateway is running and healthy",
     response_description="Health status of the gateway"
 )
-async def health_check() -> JSONResponse:
+async def health_check() -> Response:
     """Gateway health check endpoint.
     
+    Served at both /health and /readyz; use /readyz for a Kubernetes
+    readinessProbe and /healthz for the livenessProbe.
+    
     This endpoint checks:
     - If the application is running
-    - If the database is accessible
+    - If the database is accessible (cached for HEALTH_CACHE_TTL_SECONDS)
     
     Returns:
         JSON response with health status
     """
     # Check database health
-    db_healthy = await health_check_database()
+    db_healthy = await get_cached_database_health()
     
-    health_status = {
-        "status": "healthy" if db_healthy else "unhealthy",
-        "service": settings.app_name,
-        "version": settings.app_version,
-        "database": "healthy" if db_healthy else "unhealthy",
-    }
-    
-    status_code = 200 if db_healthy else 503
-    
-    return JSONResponse(
-        content=health_status,
-        status_code=status_code
-    )
+    return _HEALTHY_RESPONSE if db_healthy else _UNHEALTHY_RESPONSE
 
 
 # Root endpoint - redirect to dashboard
@@ -206,6 +440,7 @@ app.include_router(inference.router)
 # UI router (Phase 6)
 from app.routers import ui
 app.include_router(ui.router)
+LIFESPANS.append(ui.ui_lifespan)
 
 # Mount static files for Web UI (Phase 6)
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
@@ -220,6 +455,9 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
+        workers=None if settings.reload else settings.workers,
         log_level=settings.log_level.lower(),
+        loop="uvloop",
+        http="httptools",
     )
 
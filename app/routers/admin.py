@@ -7,9 +7,13 @@ This module provides endpoints for:
 - Listing all registered servers
 """
 
+import asyncio
+import hashlib
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import JSONResponse
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse, Response
 
 from app.utils.auth import verify_admin_api_key, verify_admin_auth
 from app.utils.config import get_settings
@@ -28,9 +32,9 @@ from app.services.registry import (
     deregister_server,
     update_server,
     list_servers,
-    get_server_by_registration_id,
-    get_server_count,
-    get_model_count
+    get_counts,
+    get_health_status_counts,
+    update_health_status
 )
 from app.services.health import perform_initial_health_check
 
@@ -44,6 +48,128 @@ router = APIRouter(
 )
 
 
+# Error payloads that never vary are built once and shared by every request
+_ERR_REGISTRATION_FAILED = {
+    "error": {
+        "message": "Failed to register server",
+        "type": "server_error",
+        "code": "registration_failed"
+    }
+}
+_ERR_DEREGISTRATION_FAILED = {
+    "error": {
+        "message": "Failed to deregister server",
+        "type": "server_error",
+        "code": "deregistration_failed"
+    }
+}
+_ERR_UPDATE_FAILED = {
+    "error": {
+        "message": "Failed to update server",
+        "type": "server_error",
+        "code": "update_failed"
+    }
+}
+_ERR_LIST_FAILED = {
+    "error": {
+        "message": "Failed to list servers",
+        "type": "server_error",
+        "code": "list_failed"
+    }
+}
+_ERR_SERVER_RETRIEVAL_FAILED = {
+    "error": {
+        "message": "Failed to retrieve server details",
+        "type": "server_error",
+        "code": "server_retrieval_failed"
+    }
+}
+_ERR_STATS_FAILED = {
+    "error": {
+        "message": "Failed to get statistics",
+        "type": "server_error",
+        "code": "stats_failed"
+    }
+}
+
+
+def _invalid_url_detail(error_message: str) -> dict:
+    """Build the 400 error payload for a rejected endpoint URL."""
+    return {
+        "error": {
+            "message": f"Invalid endpoint URL: {error_message}",
+            "type": "invalid_request_error",
+            "param": "endpoint_url",
+            "code": "invalid_url"
+        }
+    }
+
+
+def _server_not_found_detail(registration_id: str) -> dict:
+    """Build the 404 error payload for an unknown registration ID."""
+    return {
+        "error": {
+            "message": f"Server not found: {registration_id}",
+            "type": "invalid_request_error",
+            "param": "registration_id",
+            "code": "server_not_found"
+        }
+    }
+
+
+async def _run_initial_health_check(
+    server_id: int,
+    registration_id: str,
+    endpoint_url: str,
+    api_key: Optional[str] = None
+) -> None:
+    """Run the initial health check for a newly registered server.
+    
+    Executed as a background task after the registration response is sent.
+    Errors are logged rather than raised since there is no client to report to.
+    
+    Args:
+        server_id: Database ID of the server
+        registration_id: Registration ID of the server
+        endpoint_url: Base URL of the server
+        api_key: Optional API key for the backend server
+    """
+    try:
+        is_healthy, health_error = await perform_initial_health_check(
+            server_id=server_id,
+            registration_id=registration_id,
+            endpoint_url=endpoint_url,
+            api_key=api_key
+        )
+        
+        if is_healthy:
+            logger.info(
+                "Server %s registered successfully "
+                "and passed initial health check",
+                registration_id
+            )
+        else:
+            # Still accept registration, but warn about health
+            logger.warning(
+                "Server %s registered but "
+                "failed initial health check: %s",
+                registration_id, health_error
+            )
+        
+        await update_health_status(
+            server_id=server_id,
+            is_healthy=is_healthy,
+            error_message=health_error
+        )
+    
+    except Exception as error:
+        logger.error(
+            "Initial health check failed for server %s: %s",
+            registration_id, error,
+            exc_info=True
+        )
+
+
 @router.post(
     "/register",
     response_model=RegisterServerResponse,
@@ -52,7 +178,8 @@ router = APIRouter(
     description=(
         "Register a new model server with the gateway. The server must be "
         "publicly accessible and implement the OpenAI-compatible /v1/models endpoint. "
-        "An initial health check will be performed before accepting the registration."
+        "An initial health check is run in the background after the registration "
+        "is accepted; until it completes the server's health status is 'unknown'."
     ),
     responses={
         201: {
@@ -66,54 +193,46 @@ router = APIRouter(
         403: {
             "description": "Invalid or missing admin API key",
             "model": ErrorResponse
-        },
-        503: {
-            "description": "Initial health check failed",
-            "model": ErrorResponse
         }
     }
 )
 async def register_model_server(
-    request: RegisterServerRequest
+    request: RegisterServerRequest,
+    background_tasks: BackgroundTasks
 ) -> RegisterServerResponse:
     """Register a new model server.
     
     The registration process:
     1. Validates the endpoint URL
-    2. Performs an initial health check
-    3. Registers the server in the database
+    2. Registers the server in the database
+    3. Schedules an initial health check as a background task
     4. Returns registration details
     
     Args:
         request: Server registration details
+        background_tasks: FastAPI background task queue for the health check
     
     Returns:
         RegisterServerResponse with registration ID and details
     
     Raises:
-        HTTPException: If validation or health check fails
+        HTTPException: If validation or registration fails
     """
     logger.info(
-        f"Received registration request for model '{request.model_name}' "
-        f"at {request.endpoint_url}"
+        "Received registration request for model '%s' at %s",
+        request.model_name, request.endpoint_url
     )
     
     # Validate URL
     is_valid, error_message = validate_url(request.endpoint_url)
     if not is_valid:
         logger.warning(
-            f"Registration rejected: Invalid URL - {error_message}"
+            "Registration rejected: Invalid URL - %s",
+            error_message
         )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": {
-                    "message": f"Invalid endpoint URL: {error_message}",
-                    "type": "invalid_request_error",
-                    "param": "endpoint_url",
-                    "code": "invalid_url"
-                }
-            }
+            detail=_invalid_url_detail(error_message)
         )
     
     try:
@@ -129,61 +248,34 @@ async def register_model_server(
             initial_health_status="unknown"
         )
         
-        # Perform initial health check
-        is_healthy, health_error = await perform_initial_health_check(
+        # Probe the server after the response is sent so the client does not
+        # wait on the backend's latency; status stays "unknown" until then
+        background_tasks.add_task(
+            _run_initial_health_check,
             server_id=server_data["id"],
             registration_id=server_data["registration_id"],
             endpoint_url=request.endpoint_url,
             api_key=request.api_key
         )
         
-        # Update health status in response
-        if is_healthy:
-            health_status = "healthy"
-            logger.info(
-                f"Server {server_data['registration_id']} registered successfully "
-                f"and passed initial health check"
-            )
-        else:
-            health_status = "unhealthy"
-            logger.warning(
-                f"Server {server_data['registration_id']} registered but "
-                f"failed initial health check: {health_error}"
-            )
-            # Still accept registration, but warn about health
-            # Note: Could optionally reject here if desired
-        
-        # Import here to avoid circular dependency
-        from app.services.registry import update_health_status
-        await update_health_status(
-            server_id=server_data["id"],
-            is_healthy=is_healthy,
-            error_message=health_error
-        )
-        
         return RegisterServerResponse(
             registration_id=server_data["registration_id"],
             model_name=server_data["model_name"],
             endpoint_url=server_data["endpoint_url"],
-            health_status=health_status,
+            health_status=server_data["health_status"],
             message="Server registered successfully",
             created_at=server_data["created_at"]
         )
     
     except Exception as error:
         logger.error(
-            f"Failed to register server: {error}",
+            "Failed to register server: %s",
+            error,
             exc_info=True
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "message": "Failed to register server",
-                    "type": "server_error",
-                    "code": "registration_failed"
-                }
-            }
+            detail=_ERR_REGISTRATION_FAILED
         )
 
 
@@ -224,7 +316,7 @@ async def deregister_model_server(
     Raises:
         HTTPException: If server not found
     """
-    logger.info(f"Received deregistration request for server {registration_id}")
+    logger.info("Received deregistration request for server %s", registration_id)
     
     try:
         success = await deregister_server(registration_id)
@@ -237,32 +329,20 @@ async def deregister_model_server(
         else:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": {
-                        "message": f"Server not found: {registration_id}",
-                        "type": "invalid_request_error",
-                        "param": "registration_id",
-                        "code": "server_not_found"
-                    }
-                }
+                detail=_server_not_found_detail(registration_id)
             )
     
     except HTTPException:
         raise
     except Exception as error:
         logger.error(
-            f"Failed to deregister server {registration_id}: {error}",
+            "Failed to deregister server %s: %s",
+            registration_id, error,
             exc_info=True
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "message": "Failed to deregister server",
-                    "type": "server_error",
-                    "code": "deregistration_failed"
-                }
-            }
+            detail=_ERR_DEREGISTRATION_FAILED
         )
 
 
@@ -310,30 +390,24 @@ async def update_model_server(
     Raises:
         HTTPException: If server not found or validation fails
     """
-    logger.info(f"Received update request for server {registration_id}")
+    logger.info("Received update request for server %s", registration_id)
     
     # Validate new endpoint URL if provided
     if request.endpoint_url is not None:
         is_valid, error_message = validate_url(request.endpoint_url)
         if not is_valid:
             logger.warning(
-                f"Update rejected: Invalid URL - {error_message}"
+                "Update rejected: Invalid URL - %s",
+                error_message
             )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": {
-                        "message": f"Invalid endpoint URL: {error_message}",
-                        "type": "invalid_request_error",
-                        "param": "endpoint_url",
-                        "code": "invalid_url"
-                    }
-                }
+                detail=_invalid_url_detail(error_message)
             )
     
     try:
         # Update server in database
-        success = await update_server(
+        updated_server = await update_server(
             registration_id=registration_id,
             model_name=request.model_name,
             endpoint_url=request.endpoint_url,
@@ -344,26 +418,23 @@ async def update_model_server(
             tags=request.tags
         )
         
-        if success:
+        if updated_server:
             # If endpoint URL was changed, perform a health check
             if request.endpoint_url is not None:
                 logger.info(
-                    f"Endpoint URL changed for {registration_id}, "
-                    "performing health check"
+                    "Endpoint URL changed for %s, performing health check",
+                    registration_id
+                )
+                is_healthy, _ = await perform_initial_health_check(
+                    server_id=updated_server["id"],
+                    registration_id=registration_id,
+                    endpoint_url=request.endpoint_url,
+                    api_key=updated_server["api_key"]
+                )
+                await update_health_status(
+                    server_id=updated_server["id"],
+                    is_healthy=is_healthy
                 )
-                server_data = await get_server_by_registration_id(registration_id)
-                if server_data:
-                    is_healthy, _ = await perform_initial_health_check(
-                        server_id=server_data["id"],
-                        registration_id=registration_id,
-                        endpoint_url=request.endpoint_url,
-                        api_key=request.api_key or server_data.get("api_key")
-                    )
-                    from app.services.registry import update_health_status
-                    await update_health_status(
-                        server_id=server_data["id"],
-                        is_healthy=is_healthy
-                    )
             
             return SuccessResponse(
                 success=True,
@@ -372,32 +443,20 @@ async def update_model_server(
         else:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": {
-                        "message": f"Server not found: {registration_id}",
-                        "type": "invalid_request_error",
-                        "param": "registration_id",
-                        "code": "server_not_found"
-                    }
-                }
+                detail=_server_not_found_detail(registration_id)
             )
     
     except HTTPException:
         raise
     except Exception as error:
         logger.error(
-            f"Failed to update server {registration_id}: {error}",
+            "Failed to update server %s: %s",
+            registration_id, error,
             exc_info=True
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "message": "Failed to update server",
-                    "type": "server_error",
-                    "code": "update_failed"
-                }
-            }
+            detail=_ERR_UPDATE_FAILED
         )
 
 
@@ -432,21 +491,29 @@ async def list_model_servers(
     include_inactive: bool = Query(
         False,
         description="Include inactive/deregistered servers"
+    ),
+    if_none_match: Optional[str] = Header(
+        None,
+        description="ETag from a previous response; returns 304 if unchanged"
     )
-) -> ServerListResponse:
+) -> Response:
     """List all registered servers.
     
+    The response carries an ETag derived from its body, so polling clients
+    that send If-None-Match get an empty 304 when nothing has changed.
+    
     Args:
         model_name: Optional filter by model name
         health_status: Optional filter by health status
         include_inactive: Whether to include inactive servers
+        if_none_match: Optional ETag from a previous listing
     
     Returns:
-        ServerListResponse with list of servers and metadata
+        ServerListResponse with list of servers and metadata, or 304
     """
     logger.info(
-        f"Listing servers (model: {model_name}, status: {health_status}, "
-        f"include_inactive: {include_inactive})"
+        "Listing servers (model: %s, status: %s, include_inactive: %s)",
+        model_name, health_status, include_inactive
     )
     
     try:
@@ -456,32 +523,42 @@ async def list_model_servers(
             include_inactive=include_inactive
         )
         
-        # Build filters_applied dict
-        filters_applied = {}
-        if model_name:
-            filters_applied["model_name"] = model_name
-        if health_status:
-            filters_applied["health_status"] = health_status
-        if include_inactive:
-            filters_applied["include_inactive"] = include_inactive
+        filters_applied = {
+            key: value
+            for key, value in (
+                ("model_name", model_name),
+                ("health_status", health_status),
+                ("include_inactive", include_inactive),
+            )
+            if value
+        }
+        
+        body = orjson.dumps(
+            ServerListResponse(
+                servers=servers,
+                total=len(servers),
+                filters_applied=filters_applied
+            ).model_dump()
+        )
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        
+        if if_none_match == etag:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag}
+            )
         
-        return ServerListResponse(
-            servers=servers,
-            total=len(servers),
-            filters_applied=filters_applied
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"ETag": etag}
         )
     
     except Exception as error:
-        logger.error(f"Failed to list servers: {error}", exc_info=True)
+        logger.error("Failed to list servers: %s", error, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "message": "Failed to list servers",
-                    "type": "server_error",
-                    "code": "list_failed"
-                }
-            }
+            detail=_ERR_LIST_FAILED
         )
 
 
@@ -536,13 +613,7 @@ async def get_server(registration_id: str):
         logger.error(f"Failed to get server details: {error}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "message": "Failed to retrieve server details",
-                    "type": "server_error",
-                    "code": "server_retrieval_failed"
-                }
-            }
+            detail=_ERR_SERVER_RETRIEVAL_FAILED
         )
 
 
@@ -560,43 +631,35 @@ async def get_server(registration_id: str):
         }
     }
 )
-async def get_statistics() -> JSONResponse:
+async def get_statistics() -> ORJSONResponse:
     """Get gateway statistics.
     
     Returns:
         JSON response with statistics
     """
     try:
-        total_servers = await get_server_count()
-        total_models = await get_model_count()
-        
-        # Get servers by health status
-        healthy_servers = await list_servers(health_status="healthy")
-        unhealthy_servers = await list_servers(health_status="unhealthy")
-        unknown_servers = await list_servers(health_status="unknown")
+        # Run the independent queries concurrently
+        (total_servers, total_models), health_counts = await asyncio.gather(
+            get_counts(),
+            get_health_status_counts()
+        )
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "total_servers": total_servers,
                 "total_models": total_models,
                 "servers_by_health": {
-                    "healthy": len(healthy_servers),
-                    "unhealthy": len(unhealthy_servers),
-                    "unknown": len(unknown_servers)
+                    "healthy": health_counts.get("healthy", 0),
+                    "unhealthy": health_counts.get("unhealthy", 0),
+                    "unknown": health_counts.get("unknown", 0)
                 }
             }
         )
     
     except Exception as error:
-        logger.error(f"Failed to get statistics: {error}", exc_info=True)
+        logger.error("Failed to get statistics: %s", error, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": {
-                    "message": "Failed to get statistics",
-                    "type": "server_error",
-                    "code": "stats_failed"
-                }
-            }
+            detail=_ERR_STATS_FAILED
         )
 
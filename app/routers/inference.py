@@ -5,30 +5,26 @@ requests to hosted models. It provides OpenAI-compatible API endpoints
 for chat completions, completions, and model listing.
 """
 
+import logging
 import time
-import uuid
 from typing import Union
-from fastapi import APIRouter, HTTPException, Header, Response
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.utils.logger import get_logger
 from app.utils.models import (
     ChatCompletionRequest,
-    ChatCompletionResponse,
     CompletionRequest,
-    CompletionResponse,
     ModelListResponse,
-    ModelInfo,
     ErrorResponse,
     ErrorDetail,
 )
 from app.services.router import (
-    handle_request,
-    get_healthy_servers,
     handle_streaming_request,
-    update_server_last_successful_request
+    record_successful_request
 )
-from app.utils.database import get_db_connection
+from app.services.registry import get_healthy_model_names
+from app.services.batcher import dispatch_request
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/v1", tags=["inference"])
@@ -39,7 +35,7 @@ def create_error_response(
     message: str,
     error_type: str = "invalid_request_error",
     param: str = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create an OpenAI-compatible error response.
 
     Args:
@@ -49,7 +45,7 @@ def create_error_response(
         param: Parameter that caused the error (optional)
 
     Returns:
-        JSONResponse with error details
+        ORJSONResponse with error details
     """
     error = ErrorResponse(
         error=ErrorDetail(
@@ -61,7 +57,7 @@ def create_error_response(
     )
 
     logger.error(
-        f"Returning error response: {status_code} - {message}",
+        "Returning error response: %d - %s", status_code, message,
         extra={
             "error_type": error_type,
             "status_code": status_code,
@@ -69,193 +65,202 @@ def create_error_response(
         }
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content=error.model_dump()
     )
 
 
-@router.get("/models", response_model=ModelListResponse)
-async def list_models():
+@router.get("/models", responses={200: {"model": ModelListResponse}})
+async def list_models() -> ORJSONResponse:
     """List all available models.
 
     Returns a list of models that have at least one healthy server registered.
-    This endpoint matches the OpenAI /v1/models API format.
+    This endpoint matches the OpenAI /v1/models API format. The payload is
+    built as plain dicts (documented as ModelListResponse) so the response
+    skips per-model Pydantic construction and validation.
 
     Returns:
-        ModelListResponse with list of available models
+        ORJSONResponse with list of available models
     """
-    logger.info("Received request to list available models")
+    logger.debug("Received request to list available models")
 
     try:
-        conn = await get_db_connection()
+        # Unique models with at least one healthy server (briefly cached)
+        model_names = await get_healthy_model_names()
 
-        # Query for unique models with at least one healthy server
-        query = """
-            SELECT DISTINCT model_name
-            FROM model_servers
-            WHERE health_status = 'healthy'
-                AND is_active = 1
-            ORDER BY model_name
-        """
-
-        cursor = await conn.execute(query)
-        rows = await cursor.fetchall()
-        model_names = [row[0] for row in rows]
-
-        await conn.close()
-
-        # Create model info objects
+        # One timestamp for the whole listing
+        created = int(time.time())
         models = [
-            ModelInfo(
-                id=model_name,
-                object="model",
-                created=int(time.time()),
-                owned_by="system"
-            )
+            {
+                "id": model_name,
+                "object": "model",
+                "created": created,
+                "owned_by": "system"
+            }
             for model_name in model_names
         ]
 
-        logger.info(f"Returning {len(models)} available model(s): {model_names}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Returning %d available model(s): %s", len(models), model_names
+            )
 
-        return ModelListResponse(
-            object="list",
-            data=models
-        )
+        return ORJSONResponse({"object": "list", "data": models})
 
     except Exception as exc:
-        logger.error(f"Error listing models: {str(exc)}", exc_info=True)
+        logger.error("Error listing models: %s", exc, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Internal server error while listing models"
         )
 
 
-@router.post("/chat/completions")
-async def create_chat_completion(
-    request: ChatCompletionRequest,
-    response: Response
-):
-    """Create a chat completion using the specified model.
+async def _proxy(
+    endpoint: str,
+    request: Union[ChatCompletionRequest, CompletionRequest],
+    http_request: Request,
+    label: str
+) -> Union[ORJSONResponse, StreamingResponse]:
+    """Route an inference request to a backend and build the client response.
 
-    This endpoint matches the OpenAI /v1/chat/completions API format.
-    It routes the request to a healthy server hosting the requested model.
-    Supports both streaming and non-streaming modes.
+    Shared implementation of the chat completion and completion endpoints:
+    streaming requests are proxied as SSE, non-streaming requests go
+    through dispatch_request and its retry/failover logic. The model is
+    only used for validation and routing; the client's original JSON body
+    is forwarded to the backend as-is.
 
     Args:
-        request: ChatCompletionRequest with messages and parameters
-        response: FastAPI Response object for setting headers
+        endpoint: Backend API endpoint path (e.g. '/v1/chat/completions')
+        request: Validated request model
+        http_request: Incoming request, whose raw body is forwarded
+        label: Human-readable request kind used in log messages
 
     Returns:
-        ChatCompletionResponse from the backend server (non-streaming)
+        ORJSONResponse with the backend result or an error (non-streaming)
         StreamingResponse with SSE chunks (streaming)
-
-    Raises:
-        HTTPException: If model not found or all servers unhealthy
     """
     logger.info(
-        f"Received chat completion request for model '{request.model}'",
-        extra={
-            "model": request.model,
-            "num_messages": len(request.messages),
-            "stream": request.stream
-        }
+        "Received %s request for model '%s'", label, request.model,
+        extra={"model": request.model, "stream": request.stream}
     )
 
-    # Convert request to dict for forwarding
-    request_data = request.model_dump(exclude_none=True)
+    # Body bytes are already buffered by FastAPI's validation, so this
+    # re-reads nothing and avoids re-serializing the parsed model
+    request_body = await http_request.body()
 
     # Handle streaming requests
     if request.stream:
-        logger.info(f"Processing streaming chat completion for model '{request.model}'")
-        
+        logger.info("Processing streaming %s for model '%s'", label, request.model)
+
         server, stream_generator, error_msg = await handle_streaming_request(
             model_name=request.model,
-            endpoint="/v1/chat/completions",
-            request_data=request_data
+            endpoint=endpoint,
+            request_body=request_body
         )
-        
-        if error_msg:
-            logger.error(f"Streaming request failed: {error_msg}")
+
+        if error_msg or not server:
+            logger.error("Streaming request failed: %s", error_msg)
             return create_error_response(
                 status_code=503,
-                message=error_msg,
+                message=error_msg or "Failed to select server",
                 error_type="service_unavailable_error"
             )
-        
-        # Add custom header to indicate which server is handling the request
-        if server:
-            response.headers["X-Gateway-Server-ID"] = server['registration_id']
-            
-            # Update last successful request timestamp when stream completes
-            async def stream_with_cleanup():
-                try:
-                    async for chunk in stream_generator:
-                        yield chunk
-                    # Mark as successful after stream completes
-                    await update_server_last_successful_request(server['id'])
-                except Exception as exc:
-                    logger.error(
-                        f"Error during streaming: {str(exc)}",
-                        exc_info=True
-                    )
-                    # Don't propagate the error, just log it
-            
-            return StreamingResponse(
-                stream_with_cleanup(),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "X-Gateway-Server-ID": server['registration_id']
-                }
-            )
-    
+
+        # Update last successful request timestamp when stream completes
+        async def stream_with_cleanup():
+            try:
+                async for chunk in stream_generator:
+                    yield chunk
+                # Mark as successful after stream completes
+                await record_successful_request(server['id'])
+            except Exception as exc:
+                logger.error(
+                    "Error during streaming: %s", exc,
+                    exc_info=True
+                )
+                # Don't propagate the error, just log it
+
+        return StreamingResponse(
+            stream_with_cleanup(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
+                "X-Gateway-Server-ID": server['registration_id']
+            }
+        )
+
     # Handle non-streaming requests
-    status_code, response_data, error_msg, server_id = await handle_request(
+    status_code, response_data, error_msg, server_id = await dispatch_request(
         model_name=request.model,
-        endpoint="/v1/chat/completions",
-        request_data=request_data,
+        endpoint=endpoint,
+        request_body=request_body,
         max_retries=2
     )
 
-    # Add custom header to indicate which server handled the request
-    if server_id:
-        response.headers["X-Gateway-Server-ID"] = server_id
-
     # Handle errors
     if status_code == 503:
-        return create_error_response(
+        result = create_error_response(
             status_code=503,
             message=error_msg or "No healthy servers available for this model",
             error_type="service_unavailable_error"
         )
     elif status_code == 504:
-        return create_error_response(
+        result = create_error_response(
             status_code=504,
             message=error_msg or "All servers failed to respond",
             error_type="gateway_timeout_error"
         )
     elif status_code != 200:
-        return create_error_response(
+        result = create_error_response(
             status_code=status_code,
             message=error_msg or "Request failed",
             error_type="server_error"
         )
+    else:
+        logger.info(
+            "Successfully completed %s request for model '%s'", label, request.model,
+            extra={"server_id": server_id}
+        )
+        result = ORJSONResponse(content=response_data)
 
-    # Return successful response
-    logger.info(
-        f"Successfully completed chat completion request for model '{request.model}'",
-        extra={"server_id": server_id}
-    )
+    # Indicate which server handled the request
+    if server_id:
+        result.headers["X-Gateway-Server-ID"] = server_id
+
+    return result
+
+
+@router.post("/chat/completions")
+async def create_chat_completion(
+    request: ChatCompletionRequest,
+    http_request: Request
+):
+    """Create a chat completion using the specified model.
+
+    This endpoint matches the OpenAI /v1/chat/completions API format.
+    It routes the request to a healthy server hosting the requested model.
+    Supports both streaming and non-streaming modes.
+
+    Args:
+        request: ChatCompletionRequest with messages and parameters
+        http_request: Incoming request carrying the raw JSON body
 
-    return JSONResponse(content=response_data)
+    Returns:
+        ChatCompletionResponse from the backend server (non-streaming)
+        StreamingResponse with SSE chunks (streaming)
+    """
+    return await _proxy(
+        "/v1/chat/completions", request, http_request, "chat completion"
+    )
 
 
 @router.post("/completions")
 async def create_completion(
     request: CompletionRequest,
-    response: Response
+    http_request: Request
 ):
     """Create a text completion using the specified model.
 
@@ -265,109 +270,10 @@ async def create_completion(
 
     Args:
         request: CompletionRequest with prompt and parameters
-        response: FastAPI Response object for setting headers
+        http_request: Incoming request carrying the raw JSON body
 
     Returns:
         CompletionResponse from the backend server (non-streaming)
         StreamingResponse with SSE chunks (streaming)
-
-    Raises:
-        HTTPException: If model not found or all servers unhealthy
     """
-    logger.info(
-        f"Received completion request for model '{request.model}'",
-        extra={
-            "model": request.model,
-            "prompt_type": type(request.prompt).__name__,
-            "stream": request.stream
-        }
-    )
-
-    # Convert request to dict for forwarding
-    request_data = request.model_dump(exclude_none=True)
-
-    # Handle streaming requests
-    if request.stream:
-        logger.info(f"Processing streaming completion for model '{request.model}'")
-        
-        server, stream_generator, error_msg = await handle_streaming_request(
-            model_name=request.model,
-            endpoint="/v1/completions",
-            request_data=request_data
-        )
-        
-        if error_msg:
-            logger.error(f"Streaming request failed: {error_msg}")
-            return create_error_response(
-                status_code=503,
-                message=error_msg,
-                error_type="service_unavailable_error"
-            )
-        
-        # Add custom header to indicate which server is handling the request
-        if server:
-            response.headers["X-Gateway-Server-ID"] = server['registration_id']
-            
-            # Update last successful request timestamp when stream completes
-            async def stream_with_cleanup():
-                try:
-                    async for chunk in stream_generator:
-                        yield chunk
-                    # Mark as successful after stream completes
-                    await update_server_last_successful_request(server['id'])
-                except Exception as exc:
-                    logger.error(
-                        f"Error during streaming: {str(exc)}",
-                        exc_info=True
-                    )
-                    # Don't propagate the error, just log it
-            
-            return StreamingResponse(
-                stream_with_cleanup(),
-                media_type="text/event-stream",
-                headers={
-                    "Cache-Control": "no-cache",
-                    "Connection": "keep-alive",
-                    "X-Gateway-Server-ID": server['registration_id']
-                }
-            )
-
-    # Handle non-streaming requests
-    status_code, response_data, error_msg, server_id = await handle_request(
-        model_name=request.model,
-        endpoint="/v1/completions",
-        request_data=request_data,
-        max_retries=2
-    )
-
-    # Add custom header to indicate which server handled the request
-    if server_id:
-        response.headers["X-Gateway-Server-ID"] = server_id
-
-    # Handle errors
-    if status_code == 503:
-        return create_error_response(
-            status_code=503,
-            message=error_msg or "No healthy servers available for this model",
-            error_type="service_unavailable_error"
-        )
-    elif status_code == 504:
-        return create_error_response(
-            status_code=504,
-            message=error_msg or "All servers failed to respond",
-            error_type="gateway_timeout_error"
-        )
-    elif status_code != 200:
-        return create_error_response(
-            status_code=status_code,
-            message=error_msg or "Request failed",
-            error_type="server_error"
-        )
-
-    # Return successful response
-    logger.info(
-        f"Successfully completed completion request for model '{request.model}'",
-        extra={"server_id": server_id}
-    )
-
-    return JSONResponse(content=response_data)
+    return await _proxy("/v1/completions", request, http_request, "completion")
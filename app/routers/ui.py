@@ -4,9 +4,14 @@ This module implements all the web UI routes that serve HTML templates
 for the dashboard, registration forms, model views, and inference testing.
 """
 
-from fastapi import APIRouter, Request
+import hashlib
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Dict, Tuple
+
+from fastapi import APIRouter, FastAPI, Request, Response
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 from app.utils.logger import get_logger
 
@@ -14,8 +19,101 @@ logger = get_logger(__name__)
 
 router = APIRouter(tags=["ui"])
 
-# Set up Jinja2 templates
+# Set up Jinja2 templates. Compiled templates are also cached on disk (in a
+# per-user temp directory) so restarts skip re-parsing unchanged templates.
 templates = Jinja2Templates(directory="app/templates")
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+
+# Every template served by this router, including the shared base layout
+TEMPLATE_NAMES = (
+    "base.html",
+    "dashboard.html",
+    "register.html",
+    "server_detail.html",
+    "server_edit.html",
+    "models.html",
+    "inference_test.html",
+    "logs.html",
+    "settings.html",
+)
+
+
+# Pages whose templates only depend on the request, i.e. render to the same
+# HTML every time. Their data is loaded client-side from the API.
+STATIC_PAGES = (
+    "dashboard.html",
+    "register.html",
+    "models.html",
+    "inference_test.html",
+    "logs.html",
+    "settings.html",
+)
+
+# Rendered body and ETag per static page, filled at startup or on first use
+_RENDERED: Dict[str, Tuple[bytes, str]] = {}
+
+
+def _get_rendered_page(name: str) -> Tuple[bytes, str]:
+    """Get the pre-rendered HTML and ETag for a static page.
+    
+    Args:
+        name: Template name from STATIC_PAGES
+    
+    Returns:
+        Tuple of (encoded HTML body, quoted ETag)
+    """
+    rendered = _RENDERED.get(name)
+    if rendered is None:
+        body = templates.get_template(name).render().encode("utf-8")
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        rendered = _RENDERED[name] = (body, etag)
+    return rendered
+
+
+def _static_page_response(request: Request, name: str) -> Response:
+    """Serve a pre-rendered static page, honouring If-None-Match.
+    
+    Args:
+        request: FastAPI Request object
+        name: Template name from STATIC_PAGES
+    
+    Returns:
+        304 response if the client's copy is current, otherwise the page
+    """
+    body, etag = _get_rendered_page(name)
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return HTMLResponse(body, headers=headers)
+
+
+def warm_templates() -> None:
+    """Load and compile all UI templates into Jinja's template cache.
+    
+    Called at startup so the first request to each page does not pay
+    the template parse/compile cost.
+    """
+    for name in TEMPLATE_NAMES:
+        templates.env.get_template(name)
+    logger.info(f"Warmed {len(TEMPLATE_NAMES)} UI templates")
+
+
+@asynccontextmanager
+async def ui_lifespan(app: FastAPI) -> AsyncGenerator:
+    """Warm the UI template cache and pre-render static pages on startup.
+    
+    Args:
+        app: FastAPI application instance
+    
+    Yields:
+        None
+    """
+    warm_templates()
+    for name in STATIC_PAGES:
+        _get_rendered_page(name)
+    yield
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -44,10 +142,7 @@ async def dashboard(request: Request):
         HTML response with dashboard page
     """
     logger.info("Serving dashboard page")
-    return templates.TemplateResponse(
-        "dashboard.html",
-        {"request": request}
-    )
+    return _static_page_response(request, "dashboard.html")
 
 
 @router.get("/register", response_class=HTMLResponse)
@@ -63,10 +158,7 @@ async def register_page(request: Request):
         HTML response with registration form
     """
     logger.info("Serving registration form page")
-    return templates.TemplateResponse(
-        "register.html",
-        {"request": request}
-    )
+    return _static_page_response(request, "register.html")
 
 
 @router.get("/server/{registration_id}", response_class=HTMLResponse)
@@ -123,10 +215,7 @@ async def models_page(request: Request):
         HTML response with models list page
     """
     logger.info("Serving models list page")
-    return templates.TemplateResponse(
-        "models.html",
-        {"request": request}
-    )
+    return _static_page_response(request, "models.html")
 
 
 @router.get("/test", response_class=HTMLResponse)
@@ -143,10 +232,7 @@ async def inference_test_page(request: Request):
         HTML response with inference test page
     """
     logger.info("Serving inference test page")
-    return templates.TemplateResponse(
-        "inference_test.html",
-        {"request": request}
-    )
+    return _static_page_response(request, "inference_test.html")
 
 
 @router.get("/logs", response_class=HTMLResponse)
@@ -162,10 +248,7 @@ async def logs_page(request: Request):
         HTML response with logs viewer page
     """
     logger.info("Serving logs viewer page")
-    return templates.TemplateResponse(
-        "logs.html",
-        {"request": request}
-    )
+    return _static_page_response(request, "logs.html")
 
 
 @router.get("/settings", response_class=HTMLResponse)
@@ -181,8 +264,5 @@ async def settings_page(request: Request):
         HTML response with settings page
     """
     logger.info("Serving settings page")
-    return templates.TemplateResponse(
-        "settings.html",
-        {"request": request}
-    )
+    return _static_page_response(request, "settings.html")
 
@@ -0,0 +1,261 @@
+"""Request batching service for non-streaming inference requests.
+
+This module groups concurrent requests for the same model into short
+micro-batches. Requests that arrive within a small window are released
+to the backends together, so servers with continuous batching (e.g. vLLM)
+pick them up in the same scheduling iteration instead of one at a time.
+
+Backends only expose the standard OpenAI endpoints, so a batch is
+dispatched as concurrent individual requests rather than one combined
+HTTP call.
+
+Only models with healthy servers are queued, and a model's dispatcher is
+stopped after it has been idle for a while, so arbitrary client-supplied
+model names cannot grow the set of queues and tasks.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional, Set, Tuple
+
+from app.utils.config import get_settings
+from app.utils.logger import get_logger
+from app.services.router import get_healthy_servers, handle_request
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Result of handle_request: (status_code, response_dict, error_message, server_id)
+RequestResult = Tuple[int, Dict[Any, Any], Optional[str], Optional[str]]
+
+
+class RequestBatcher:
+    """Per-model micro-batcher for inference requests.
+
+    Each model gets its own queue and dispatcher task. The dispatcher waits
+    for the first request, collects any others arriving within
+    ``max_wait_ms`` (up to ``max_batch_size``), then forwards the whole
+    batch concurrently. Once the batch holds ``min_batch_size`` requests it
+    is released as soon as nothing else is queued, so with the default of
+    1 a request arriving alone is not held for the full window.
+
+    A dispatcher with no requests for IDLE_TIMEOUT_SECONDS exits and its
+    queue is dropped; the next request for the model starts a new one.
+    """
+
+    # How long a model's dispatcher waits for work before exiting
+    IDLE_TIMEOUT_SECONDS = 60.0
+
+    def __init__(self, max_batch_size: int, max_wait_ms: float, min_batch_size: int = 1):
+        """Initialize the batcher.
+
+        Args:
+            max_batch_size: Maximum number of requests released together
+            max_wait_ms: How long to hold the first request of a batch (ms)
+            min_batch_size: Batch size at which the batch is released as
+                soon as nothing else is queued
+        """
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_ms) / 1000
+        self.min_batch_size = min(max(1, min_batch_size), self.max_batch_size)
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._dispatchers: Dict[str, asyncio.Task] = {}
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        model_name: str,
+        endpoint: str,
+        request_body: bytes,
+        max_retries: int = 2
+    ) -> RequestResult:
+        """Queue a request and wait for its result.
+
+        Args:
+            model_name: Name of the model being requested
+            endpoint: API endpoint path
+            request_body: Raw JSON request body
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            Tuple of (status_code, response_dict, error_message, server_id)
+        """
+        queue = self._queues.get(model_name)
+        if queue is None:
+            queue = self._queues[model_name] = asyncio.Queue()
+            self._dispatchers[model_name] = asyncio.create_task(
+                self._dispatch_loop(model_name, queue)
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((endpoint, request_body, max_retries, future))
+        return await future
+
+    async def _dispatch_loop(self, model_name: str, queue: asyncio.Queue) -> None:
+        """Collect queued requests for one model into batches and forward them.
+
+        Args:
+            model_name: Model whose queue this loop drains
+            queue: Queue of pending requests for the model
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            try:
+                first = await asyncio.wait_for(queue.get(), self.IDLE_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                if not queue.empty():
+                    continue
+                # Idle: drop this model's queue and dispatcher. There is no
+                # await between the check and the removal, so no request can
+                # be queued in between; submit() starts a new dispatcher.
+                del self._queues[model_name]
+                del self._dispatchers[model_name]
+                logger.debug(f"Stopped idle batch dispatcher for model '{model_name}'")
+                return
+
+            batch = [first]
+            deadline = loop.time() + self.max_wait_seconds
+
+            try:
+                while len(batch) < self.max_batch_size:
+                    if len(batch) >= self.min_batch_size and queue.empty():
+                        break
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Shutting down: fail the requests already taken off the queue
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(RuntimeError("Request batcher shut down"))
+                raise
+
+            logger.debug(
+                f"Dispatching batch of {len(batch)} request(s) for model '{model_name}'"
+            )
+
+            for endpoint, request_body, max_retries, future in batch:
+                if future.done():
+                    # The caller went away (e.g. client disconnect) while the
+                    # request was held; don't spend a backend generation on it
+                    continue
+                task = asyncio.create_task(
+                    self._forward(model_name, endpoint, request_body, max_retries, future)
+                )
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+
+    async def _forward(
+        self,
+        model_name: str,
+        endpoint: str,
+        request_body: bytes,
+        max_retries: int,
+        future: asyncio.Future
+    ) -> None:
+        """Forward one batched request and resolve its future.
+
+        Args:
+            model_name: Name of the model being requested
+            endpoint: API endpoint path
+            request_body: Raw JSON request body
+            max_retries: Maximum number of retry attempts
+            future: Future the submitting caller is waiting on
+        """
+        try:
+            result = await handle_request(
+                model_name=model_name,
+                endpoint=endpoint,
+                request_body=request_body,
+                max_retries=max_retries
+            )
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+            return
+
+        if not future.done():
+            future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop all dispatchers and fail any requests still queued."""
+        for task in self._dispatchers.values():
+            task.cancel()
+        await asyncio.gather(*self._dispatchers.values(), return_exceptions=True)
+
+        for queue in self._queues.values():
+            while not queue.empty():
+                *_, future = queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError("Request batcher shut down"))
+
+        # Let requests already sent to a backend finish
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+        self._queues.clear()
+        self._dispatchers.clear()
+
+
+# Global batcher, created on first use when batching is enabled
+_batcher: Optional[RequestBatcher] = None
+
+
+async def dispatch_request(
+    model_name: str,
+    endpoint: str,
+    request_body: bytes,
+    max_retries: int = 2
+) -> RequestResult:
+    """Route a non-streaming request, batching it when enabled.
+
+    With request batching disabled this is a direct call to handle_request.
+    With it enabled, requests for models without healthy servers are
+    rejected up front instead of being queued.
+
+    Args:
+        model_name: Name of the model being requested
+        endpoint: API endpoint path
+        request_body: Raw JSON request body
+        max_retries: Maximum number of retry attempts (default: 2)
+
+    Returns:
+        Tuple of (status_code, response_dict, error_message, server_id)
+    """
+    if not settings.request_batching_enabled:
+        return await handle_request(
+            model_name=model_name,
+            endpoint=endpoint,
+            request_body=request_body,
+            max_retries=max_retries
+        )
+
+    if not await get_healthy_servers(model_name):
+        logger.error(f"No healthy servers available for model '{model_name}'")
+        return 503, {}, "No healthy servers available for this model", None
+
+    global _batcher
+    if _batcher is None:
+        _batcher = RequestBatcher(
+            max_batch_size=settings.request_batch_max_size,
+            max_wait_ms=settings.request_batch_max_wait_ms,
+            min_batch_size=settings.request_batch_min_size
+        )
+
+    return await _batcher.submit(model_name, endpoint, request_body, max_retries)
+
+
+async def close_request_batcher() -> None:
+    """Shut down the global batcher, if one was started.
+
+    Called during application shutdown.
+    """
+    global _batcher
+    if _batcher is not None:
+        await _batcher.close()
+        _batcher = None
+        logger.info("Request batcher stopped")
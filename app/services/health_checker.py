@@ -6,17 +6,20 @@ fail consecutive health checks.
 """
 
 import asyncio
+import logging
+import random
 from datetime import datetime
-from typing import Optional
+from time import perf_counter
+from typing import Any, Dict, Optional
 
 from app.utils.config import get_settings
 from app.utils.logger import get_logger
+from app.utils.models import HealthCheckResult
 from app.services.health import check_server_health
 from app.services.registry import (
-    list_servers,
-    update_health_status,
-    deregister_server,
-    get_server_by_id
+    list_servers_for_health_check,
+    update_health_statuses,
+    deregister_server
 )
 
 logger = get_logger(__name__)
@@ -26,12 +29,96 @@ settings = get_settings()
 _health_checker_running = False
 _health_checker_task: Optional[asyncio.Task] = None
 
+# Set to wake the loop out of its inter-cycle wait on shutdown
+_stop_event: Optional[asyncio.Event] = None
+
+# Steady-state tracking: fingerprint of the last probed server set, whether
+# every server passed, and how many cycles have been skipped since
+_last_server_set_hash: Optional[int] = None
+_last_cycle_all_healthy = False
+_skipped_cycles = 0
+
+
+async def _wait_for_stop(timeout: float) -> bool:
+    """Wait up to ``timeout`` seconds for a stop request.
+    
+    Args:
+        timeout: Maximum time to wait in seconds
+    
+    Returns:
+        True if the health checker was asked to stop
+    """
+    if _stop_event is None:
+        await asyncio.sleep(timeout)
+        return not _health_checker_running
+    
+    try:
+        await asyncio.wait_for(_stop_event.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+
+
+async def _check_one_server(
+    server: Dict[str, Any],
+    semaphore: asyncio.Semaphore
+) -> HealthCheckResult:
+    """Health check a single server.
+    
+    Args:
+        server: Server row from list_servers_for_health_check()
+        semaphore: Semaphore bounding concurrent network probes
+    
+    Returns:
+        HealthCheckResult for the server
+    """
+    async with semaphore:
+        return await check_server_health(
+            server_id=server["id"],
+            registration_id=server["registration_id"],
+            endpoint_url=server["endpoint_url"],
+            api_key=server["api_key"]
+        )
+
+
+async def _auto_deregister(registration_id: str, consecutive_failures: int) -> bool:
+    """Deregister a server that reached the consecutive failure limit.
+    
+    Args:
+        registration_id: Registration ID of the server
+        consecutive_failures: Server's consecutive failure count
+    
+    Returns:
+        True if the server was deregistered
+    """
+    logger.error(
+        f"Server {registration_id} has failed "
+        f"{consecutive_failures} consecutive health checks. "
+        "Auto-deregistering."
+    )
+    
+    success = await deregister_server(registration_id)
+    if success:
+        logger.info(f"Server {registration_id} auto-deregistered")
+        return True
+    
+    logger.error(
+        f"Failed to auto-deregister server {registration_id}"
+    )
+    return False
+
 
 async def check_all_servers() -> dict:
     """Perform health checks on all active servers.
     
-    This function queries all active servers and checks their health status.
-    It updates the database with the results and tracks consecutive failures.
+    This function queries all active servers and checks their health status
+    concurrently, with at most HEALTH_CHECK_CONCURRENCY checks in flight.
+    The results are written back in one transaction, then servers that
+    reached the consecutive failure limit are auto-deregistered.
+    
+    When HEALTH_CHECK_FULL_EVERY_CYCLES is above 1 and the active server set
+    (ids, endpoints and stored health) is unchanged since a cycle in which
+    every server was healthy, the probes are skipped until every Nth cycle.
     
     Returns:
         Dictionary with check statistics:
@@ -41,13 +128,40 @@ async def check_all_servers() -> dict:
         - deregistered_count: Number of servers auto-deregistered
         - check_duration_seconds: Time taken to check all servers
     """
-    start_time = asyncio.get_event_loop().time()
+    global _last_server_set_hash, _last_cycle_all_healthy, _skipped_cycles
     
-    # Get all active servers
-    servers = await list_servers(include_inactive=False)
+    start_time = perf_counter()
+    
+    # Get all active servers, with credentials and failure counts
+    servers = await list_servers_for_health_check()
     
     if not servers:
         logger.debug("No active servers to check")
+        _last_server_set_hash = None
+        return {
+            "total_checked": 0,
+            "healthy_count": 0,
+            "unhealthy_count": 0,
+            "deregistered_count": 0,
+            "check_duration_seconds": 0
+        }
+    
+    # Any registration, deregistration, endpoint change or health flip made
+    # elsewhere (e.g. by the router) changes the fingerprint
+    server_set_hash = hash(tuple(
+        (server["id"], server["endpoint_url"], server["health_status"])
+        for server in servers
+    ))
+    full_every = max(1, settings.health_check_full_every_cycles)
+    
+    if (server_set_hash == _last_server_set_hash and
+            _last_cycle_all_healthy and
+            _skipped_cycles < full_every - 1):
+        _skipped_cycles += 1
+        logger.debug(
+            f"Server set unchanged and healthy; skipping probes "
+            f"({_skipped_cycles}/{full_every - 1})"
+        )
         return {
             "total_checked": 0,
             "healthy_count": 0,
@@ -56,80 +170,87 @@ async def check_all_servers() -> dict:
             "check_duration_seconds": 0
         }
     
+    _skipped_cycles = 0
+    
     logger.info(f"Starting health check cycle for {len(servers)} servers")
     
-    healthy_count = 0
-    unhealthy_count = 0
-    deregistered_count = 0
+    # Check all servers concurrently, bounded by the semaphore
+    semaphore = asyncio.Semaphore(settings.health_check_concurrency)
+    results = await asyncio.gather(
+        *(_check_one_server(server, semaphore) for server in servers),
+        return_exceptions=True
+    )
+    
+    healthy_ids = []
+    unhealthy_ids = []
+    failures = []
+    errored_count = 0
     
-    # Check each server
-    for server in servers:
-        server_id = server.id
-        registration_id = server.registration_id
-        endpoint_url = server.endpoint_url
-        api_key = None  # We don't expose api_key in ServerListItem for security
+    # Bind loop-invariant lookups once rather than per server
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    log_debug = logger.debug
+    add_healthy = healthy_ids.append
+    add_unhealthy = unhealthy_ids.append
+    
+    for server, result in zip(servers, results):
+        registration_id = server["registration_id"]
+        
+        if isinstance(result, Exception):
+            errored_count += 1
+            logger.error(f"Error checking server {registration_id}: {result}")
+            continue
         
-        # Get full server details to access api_key
-        server_details = await get_server_by_id(server_id)
-        if server_details:
-            api_key = server_details.get("api_key")
+        if result.is_healthy:
+            add_healthy(server["id"])
+            if debug_enabled:
+                log_debug(
+                    f"Server {registration_id} is healthy "
+                    f"(response time: {result.response_time_ms}ms)"
+                )
+            continue
         
-        # Perform health check
-        result = await check_server_health(
-            server_id=server_id,
-            registration_id=registration_id,
-            endpoint_url=endpoint_url,
-            api_key=api_key
+        add_unhealthy(server["id"])
+        failures.append((server, result.error_message))
+    
+    # Write every result back in a single transaction; the new failure
+    # counts come back from the UPDATE itself
+    failure_counts = await update_health_statuses(healthy_ids, unhealthy_ids)
+    
+    auto_deregister = settings.auto_deregister_after_failures
+    max_failures = settings.max_consecutive_failures
+    to_deregister = []
+    
+    for server, error_message in failures:
+        registration_id = server["registration_id"]
+        consecutive_failures = failure_counts.get(
+            server["id"], server["consecutive_failures"] + 1
         )
         
-        # Update database with result
-        await update_health_status(
-            server_id=server_id,
-            is_healthy=result.is_healthy,
-            error_message=result.error_message
+        logger.warning(
+            f"Server {registration_id} is unhealthy "
+            f"(consecutive failures: {consecutive_failures}) - "
+            f"{error_message}"
         )
         
-        if result.is_healthy:
-            healthy_count += 1
-            logger.debug(
-                f"Server {registration_id} is healthy "
-                f"(response time: {result.response_time_ms}ms)"
-            )
-        else:
-            unhealthy_count += 1
-            
-            # Get updated server details to check consecutive failures
-            updated_server = await get_server_by_id(server_id)
-            if updated_server:
-                consecutive_failures = updated_server.get("consecutive_failures", 0)
-                
-                logger.warning(
-                    f"Server {registration_id} is unhealthy "
-                    f"(consecutive failures: {consecutive_failures}) - "
-                    f"{result.error_message}"
-                )
-                
-                # Check if we should auto-deregister
-                if (settings.auto_deregister_after_failures and
-                    consecutive_failures >= settings.max_consecutive_failures):
-                    
-                    logger.error(
-                        f"Server {registration_id} has failed "
-                        f"{consecutive_failures} consecutive health checks. "
-                        "Auto-deregistering."
-                    )
-                    
-                    success = await deregister_server(registration_id)
-                    if success:
-                        deregistered_count += 1
-                        logger.info(f"Server {registration_id} auto-deregistered")
-                    else:
-                        logger.error(
-                            f"Failed to auto-deregister server {registration_id}"
-                        )
-    
-    end_time = asyncio.get_event_loop().time()
-    duration = end_time - start_time
+        if auto_deregister and consecutive_failures >= max_failures:
+            to_deregister.append((registration_id, consecutive_failures))
+    
+    deregistered_count = 0
+    for registration_id, consecutive_failures in to_deregister:
+        if await _auto_deregister(registration_id, consecutive_failures):
+            deregistered_count += 1
+    
+    healthy_count = len(healthy_ids)
+    unhealthy_count = len(unhealthy_ids) + errored_count
+    
+    # Every server now stores 'healthy', so the next fingerprint only matches
+    # if nothing else touched the set in between
+    _last_cycle_all_healthy = unhealthy_count == 0
+    _last_server_set_hash = hash(tuple(
+        (server["id"], server["endpoint_url"], "healthy") for server in servers
+    ))
+    
+    duration = perf_counter() - start_time
     
     logger.info(
         f"Health check cycle complete: {len(servers)} servers checked, "
@@ -165,6 +286,12 @@ async def health_check_loop() -> None:
     )
     
     cycle_count = 0
+    interval = settings.health_check_interval_seconds
+    loop = asyncio.get_running_loop()
+    
+    # Cycles are scheduled against fixed deadlines, so the cadence does not
+    # drift by however long each cycle takes
+    next_deadline = loop.time()
     
     while _health_checker_running:
         cycle_count += 1
@@ -182,8 +309,21 @@ async def health_check_loop() -> None:
                 f"{stats['unhealthy_count']} unhealthy"
             )
             
-            # Wait for next interval
-            await asyncio.sleep(settings.health_check_interval_seconds)
+            # Wait for the next deadline, skipping any ticks the cycle overran
+            # rather than running catch-up cycles back to back. The interval is
+            # jittered by +/-10% so multiple gateway instances do not probe the
+            # backends in lockstep.
+            next_deadline += interval * random.uniform(0.9, 1.1)
+            now = loop.time()
+            if next_deadline <= now:
+                missed = int((now - next_deadline) // interval) + 1
+                logger.warning(
+                    f"Health check cycle #{cycle_count} overran the "
+                    f"{interval}s interval; skipping {missed} tick(s)"
+                )
+                next_deadline += missed * interval
+            if await _wait_for_stop(next_deadline - now):
+                break
             
         except asyncio.CancelledError:
             logger.info("Health checker received cancellation signal")
@@ -195,8 +335,10 @@ async def health_check_loop() -> None:
                 exc_info=True
             )
             # Continue running even if one cycle fails
-            # Wait a bit before retrying
-            await asyncio.sleep(10)
+            # Wait a bit before retrying, then resume the regular cadence
+            if await _wait_for_stop(10):
+                break
+            next_deadline = loop.time()
     
     logger.info(
         f"Health checker stopped after {cycle_count} cycles"
@@ -213,7 +355,7 @@ async def start_health_checker() -> None:
     Raises:
         RuntimeError: If health checker is already running
     """
-    global _health_checker_running, _health_checker_task
+    global _health_checker_running, _health_checker_task, _stop_event
     
     if _health_checker_running:
         logger.warning("Health checker is already running")
@@ -222,6 +364,7 @@ async def start_health_checker() -> None:
     logger.info("Starting health checker background task")
     
     _health_checker_running = True
+    _stop_event = asyncio.Event()
     _health_checker_task = asyncio.create_task(health_check_loop())
     
     logger.info("Health checker background task started")
@@ -231,10 +374,10 @@ async def stop_health_checker() -> None:
     """Stop the background health checker.
     
     This function should be called during application shutdown to gracefully
-    stop the health checker. It waits for the current check cycle to complete
-    before returning.
+    stop the health checker. An idle loop wakes immediately; a check cycle
+    in progress gets up to 5 seconds to finish before it is cancelled.
     """
-    global _health_checker_running, _health_checker_task
+    global _health_checker_running, _health_checker_task, _stop_event
     
     if not _health_checker_running:
         logger.debug("Health checker is not running")
@@ -242,25 +385,29 @@ async def stop_health_checker() -> None:
     
     logger.info("Stopping health checker...")
     
-    # Signal the loop to stop
+    # Signal the loop to stop and wake it if it is waiting
     _health_checker_running = False
+    if _stop_event is not None:
+        _stop_event.set()
     
-    # Cancel the task if it exists
     if _health_checker_task:
-        _health_checker_task.cancel()
-        
         try:
-            # Wait for task to complete cancellation
-            await asyncio.wait_for(_health_checker_task, timeout=5.0)
+            # Shield so a timeout does not cancel the cycle before we decide to
+            await asyncio.wait_for(asyncio.shield(_health_checker_task), timeout=5.0)
         except asyncio.TimeoutError:
-            logger.warning("Health checker did not stop within timeout")
-        except asyncio.CancelledError:
-            logger.debug("Health checker task cancelled successfully")
+            logger.warning("Health checker did not stop within timeout; cancelling")
+            _health_checker_task.cancel()
+            try:
+                await _health_checker_task
+            except asyncio.CancelledError:
+                logger.debug("Health checker task cancelled successfully")
         except Exception as error:
             logger.error(f"Error stopping health checker: {error}", exc_info=True)
         
         _health_checker_task = None
     
+    _stop_event = None
+    
     logger.info("Health checker stopped")
 
 
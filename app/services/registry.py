@@ -5,8 +5,9 @@ all database interactions related to server registration and management.
 """
 
 import secrets
+import time
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import aiosqlite
 
 from app.utils.config import get_settings
@@ -17,6 +18,58 @@ from app.utils.models import ServerListItem
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Columns needed to build a ServerListItem (everything except api_key)
+_SERVER_LIST_COLUMNS = (
+    "id, registration_id, model_name, endpoint_url, owner_name, owner_email, "
+    "health_status, consecutive_failures, last_checked_at, "
+    "last_successful_request_at, is_active, created_at, updated_at, "
+    "description, tags"
+)
+
+# Rows fetched per thread hop when iterating a cursor with ``async for``
+# (aiosqlite fetches 64 rows per hop by default)
+_CURSOR_ITER_CHUNK_SIZE = 256
+
+# Read-through cache for list_servers keyed on its filter arguments.
+# Values are (monotonic expiry time, servers).
+_list_servers_cache: Dict[Tuple[Optional[str], Optional[str], bool], Tuple[float, List[ServerListItem]]] = {}
+
+
+# Cached names of models with at least one healthy server, as
+# (monotonic expiry time, model names)
+_healthy_models_cache: Tuple[float, List[str]] = (0.0, [])
+
+# Bumped on every invalidation so caches kept outside this module (e.g. the
+# router's) can tell their entries are stale
+_cache_generation = 0
+
+
+def invalidate_server_cache() -> None:
+    """Drop all cached server listings and healthy-model results.
+    
+    Must be called after any write that changes model_servers rows so
+    listings do not serve stale data for the rest of the TTL window.
+    """
+    global _healthy_models_cache, _cache_generation
+    _list_servers_cache.clear()
+    _healthy_models_cache = (0.0, [])
+    _cache_generation += 1
+
+
+def get_server_cache_generation() -> int:
+    """Get the current server cache generation.
+    
+    Returns:
+        Counter incremented by every invalidate_server_cache() call
+    """
+    return _cache_generation
+
+
+# Pre-drawn CSPRNG bytes for registration IDs, consumed 8 bytes at a time
+# from the end so bulk registrations do not hit the OS RNG per ID
+_REGISTRATION_ID_BYTES = 8
+_random_pool = bytearray()
+
 
 def generate_registration_id() -> str:
     """Generate a unique registration ID for a new server.
@@ -24,8 +77,14 @@ def generate_registration_id() -> str:
     Returns:
         A unique registration ID in format 'srv_<random_hex>'
     """
-    # Generate a 16-character random hex string
-    random_hex = secrets.token_hex(8)
+    # Refill with 4 KiB from the secrets CSPRNG when exhausted. This runs
+    # without awaiting, so no lock is needed on the event loop.
+    if len(_random_pool) < _REGISTRATION_ID_BYTES:
+        _random_pool.extend(secrets.token_bytes(4096))
+    
+    # 16-character random hex string
+    random_hex = _random_pool[-_REGISTRATION_ID_BYTES:].hex()
+    del _random_pool[-_REGISTRATION_ID_BYTES:]
     return f"srv_{random_hex}"
 
 
@@ -66,9 +125,7 @@ async def register_server(
     )
     
     try:
-        connection = await get_db_connection()
-        
-        try:
+        async with get_db_connection() as connection:
             # Insert the new server
             cursor = await connection.execute(
                 """
@@ -88,6 +145,7 @@ async def register_server(
             
             server_id = cursor.lastrowid
             await connection.commit()
+            invalidate_server_cache()
             
             logger.info(
                 f"Server registered successfully: {registration_id} (id: {server_id})"
@@ -103,9 +161,6 @@ async def register_server(
                 "health_status": initial_health_status,
                 "created_at": timestamp
             }
-        
-        finally:
-            await connection.close()
     
     except Exception as error:
         logger.error(f"Failed to register server: {error}", exc_info=True)
@@ -127,9 +182,7 @@ async def deregister_server(registration_id: str) -> bool:
     logger.info(f"Deregistering server: {registration_id}")
     
     try:
-        connection = await get_db_connection()
-        
-        try:
+        async with get_db_connection() as connection:
             # Soft delete by setting is_active = 0
             cursor = await connection.execute(
                 """
@@ -141,6 +194,7 @@ async def deregister_server(registration_id: str) -> bool:
             )
             
             await connection.commit()
+            invalidate_server_cache()
             
             if cursor.rowcount > 0:
                 logger.info(f"Server deregistered successfully: {registration_id}")
@@ -148,15 +202,33 @@ async def deregister_server(registration_id: str) -> bool:
             else:
                 logger.warning(f"Server not found or already deregistered: {registration_id}")
                 return False
-        
-        finally:
-            await connection.close()
     
     except Exception as error:
         logger.error(f"Failed to deregister server: {error}", exc_info=True)
         raise
 
 
+# Static partial update: a NULL parameter leaves the column unchanged, so
+# the statement text never varies and stays in SQLite's statement cache.
+# An empty api_key clears the stored key.
+_UPDATE_SERVER_SQL = """
+    UPDATE model_servers
+    SET model_name = COALESCE(:model_name, model_name),
+        endpoint_url = COALESCE(:endpoint_url, endpoint_url),
+        api_key = CASE
+            WHEN :api_key IS NULL THEN api_key
+            ELSE NULLIF(:api_key, '')
+        END,
+        owner_name = COALESCE(:owner_name, owner_name),
+        owner_email = COALESCE(:owner_email, owner_email),
+        description = COALESCE(:description, description),
+        tags = COALESCE(:tags, tags),
+        updated_at = :updated_at
+    WHERE registration_id = :registration_id AND is_active = 1
+    RETURNING id, api_key
+"""
+
+
 async def update_server(
     registration_id: str,
     model_name: Optional[str] = None,
@@ -166,7 +238,7 @@ async def update_server(
     owner_email: Optional[str] = None,
     description: Optional[str] = None,
     tags: Optional[str] = None
-) -> bool:
+) -> Optional[Dict[str, Any]]:
     """Update server details.
     
     Args:
@@ -180,78 +252,44 @@ async def update_server(
         tags: New tags (if provided)
     
     Returns:
-        True if server was updated, False if not found
+        Dictionary with the updated server's id and api_key, or None if the
+        server was not found or no fields were provided
     
     Raises:
         Exception: If database operation fails
     """
     logger.info(f"Updating server: {registration_id}")
     
-    # Build dynamic UPDATE query based on provided fields
-    update_fields = []
-    params = []
-    
-    if model_name is not None:
-        update_fields.append("model_name = ?")
-        params.append(model_name)
-    
-    if endpoint_url is not None:
-        update_fields.append("endpoint_url = ?")
-        params.append(endpoint_url)
-    
-    if api_key is not None:
-        update_fields.append("api_key = ?")
-        params.append(api_key if api_key else None)  # Empty string becomes NULL
-    
-    if owner_name is not None:
-        update_fields.append("owner_name = ?")
-        params.append(owner_name)
-    
-    if owner_email is not None:
-        update_fields.append("owner_email = ?")
-        params.append(owner_email)
-    
-    if description is not None:
-        update_fields.append("description = ?")
-        params.append(description)
-    
-    if tags is not None:
-        update_fields.append("tags = ?")
-        params.append(tags)
-    
-    if not update_fields:
+    fields = (model_name, endpoint_url, api_key, owner_name, owner_email, description, tags)
+    if all(value is None for value in fields):
         logger.warning(f"No fields to update for server: {registration_id}")
-        return False
-    
-    # Always update the updated_at timestamp
-    update_fields.append("updated_at = ?")
-    params.append(get_timestamp())
-    
-    # Add registration_id to params for WHERE clause
-    params.append(registration_id)
+        return None
+    
+    params = {
+        "model_name": model_name,
+        "endpoint_url": endpoint_url,
+        "api_key": api_key,
+        "owner_name": owner_name,
+        "owner_email": owner_email,
+        "description": description,
+        "tags": tags,
+        "updated_at": get_timestamp(),
+        "registration_id": registration_id,
+    }
     
     try:
-        connection = await get_db_connection()
-        
-        try:
-            query = f"""
-                UPDATE model_servers
-                SET {', '.join(update_fields)}
-                WHERE registration_id = ? AND is_active = 1
-            """
-            
-            cursor = await connection.execute(query, params)
+        async with get_db_connection(named_rows=True) as connection:
+            cursor = await connection.execute(_UPDATE_SERVER_SQL, params)
+            row = await cursor.fetchone()
             await connection.commit()
+            invalidate_server_cache()
             
-            if cursor.rowcount > 0:
+            if row:
                 logger.info(f"Server updated successfully: {registration_id}")
-                return True
+                return dict(row)
             else:
                 logger.warning(f"Server not found: {registration_id}")
-                return False
-        
-        finally:
-            await connection.close()
+                return None
     
     except Exception as error:
         logger.error(f"Failed to update server: {error}", exc_info=True)
@@ -268,9 +306,7 @@ async def get_server_by_id(server_id: int) -> Optional[Dict[str, Any]]:
         Dictionary with server details, or None if not found
     """
     try:
-        connection = await get_db_connection()
-        
-        try:
+        async with get_db_connection(named_rows=True) as connection:
             cursor = await connection.execute(
                 """
                 SELECT * FROM model_servers
@@ -286,9 +322,6 @@ async def get_server_by_id(server_id: int) -> Optional[Dict[str, Any]]:
                 return dict(row)
             else:
                 return None
-        
-        finally:
-            await connection.close()
     
     except Exception as error:
         logger.error(f"Failed to get server by ID {server_id}: {error}", exc_info=True)
@@ -305,9 +338,7 @@ async def get_server_by_registration_id(registration_id: str) -> Optional[Dict[s
         Dictionary with server details, or None if not found
     """
     try:
-        connection = await get_db_connection()
-        
-        try:
+        async with get_db_connection(named_rows=True) as connection:
             cursor = await connection.execute(
                 """
                 SELECT * FROM model_servers
@@ -322,9 +353,6 @@ async def get_server_by_registration_id(registration_id: str) -> Optional[Dict[s
                 return dict(row)
             else:
                 return None
-        
-        finally:
-            await connection.close()
     
     except Exception as error:
         logger.error(
@@ -346,6 +374,9 @@ async def list_servers(
         health_status: Filter by health status (if provided)
         include_inactive: Whether to include inactive servers
     
+    Results are cached for SERVER_LIST_CACHE_TTL_SECONDS per filter
+    combination; writes through this module invalidate the cache.
+    
     Returns:
         List of ServerListItem objects
     """
@@ -354,12 +385,15 @@ async def list_servers(
         f"include_inactive: {include_inactive})"
     )
     
+    cache_key = (model_name, health_status, include_inactive)
+    cached = _list_servers_cache.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        return list(cached[1])
+    
     try:
-        connection = await get_db_connection()
-        
-        try:
+        async with get_db_connection(named_rows=True) as connection:
             # Build query with filters
-            query = "SELECT * FROM model_servers WHERE 1=1"
+            query = f"SELECT {_SERVER_LIST_COLUMNS} FROM model_servers WHERE 1=1"
             params = []
             
             if not include_inactive:
@@ -377,21 +411,26 @@ async def list_servers(
             query += " ORDER BY created_at DESC"
             
             cursor = await connection.execute(query, params)
-            rows = await cursor.fetchall()
+            # Iterate in chunks rather than materialising a full row list
+            cursor.iter_chunk_size = _CURSOR_ITER_CHUNK_SIZE
             
-            # Convert rows to ServerListItem objects
+            # Convert rows to ServerListItem objects. Rows come straight from
+            # our own schema, so skip per-row Pydantic validation.
             servers = []
-            for row in rows:
+            async for row in cursor:
                 row_dict = dict(row)
                 # Convert integer boolean to Python boolean
                 row_dict["is_active"] = bool(row_dict["is_active"])
-                servers.append(ServerListItem(**row_dict))
+                servers.append(ServerListItem.model_construct(**row_dict))
             
             logger.debug(f"Found {len(servers)} servers matching criteria")
-            return servers
-        
-        finally:
-            await connection.close()
+            
+            if settings.server_list_cache_ttl_seconds > 0:
+                _list_servers_cache[cache_key] = (
+                    time.monotonic() + settings.server_list_cache_ttl_seconds,
+                    servers
+                )
+            return list(servers)
     
     except Exception as error:
         logger.error(f"Failed to list servers: {error}", exc_info=True)
@@ -401,7 +440,8 @@ async def list_servers(
 async def find_healthy_servers(model_name: str) -> List[Dict[str, Any]]:
     """Find all healthy servers for a specific model.
     
-    This is used by the routing service to find available servers.
+    Request routing does not use this; it reads the cached, trimmed
+    server list from router.get_healthy_servers instead.
     
     Args:
         model_name: Name of the model to search for
@@ -412,12 +452,12 @@ async def find_healthy_servers(model_name: str) -> List[Dict[str, Any]]:
     logger.debug(f"Finding healthy servers for model: {model_name}")
     
     try:
-        connection = await get_db_connection()
-        
-        try:
+        async with get_db_connection(named_rows=True) as connection:
             cursor = await connection.execute(
                 """
-                SELECT * FROM model_servers
+                SELECT id, registration_id, model_name, endpoint_url, api_key,
+                       consecutive_failures, last_successful_request_at
+                FROM model_servers
                 WHERE model_name = ?
                   AND health_status = 'healthy'
                   AND is_active = 1
@@ -427,14 +467,11 @@ async def find_healthy_servers(model_name: str) -> List[Dict[str, Any]]:
                 (model_name,)
             )
             
-            rows = await cursor.fetchall()
-            servers = [dict(row) for row in rows]
+            cursor.iter_chunk_size = _CURSOR_ITER_CHUNK_SIZE
+            servers = [dict(row) async for row in cursor]
             
             logger.debug(f"Found {len(servers)} healthy servers for model {model_name}")
             return servers
-        
-        finally:
-            await connection.close()
     
     except Exception as error:
         logger.error(
@@ -444,27 +481,72 @@ async def find_healthy_servers(model_name: str) -> List[Dict[str, Any]]:
         raise
 
 
+async def list_servers_for_health_check() -> List[Dict[str, Any]]:
+    """List active servers with the fields the health checker needs.
+    
+    Unlike list_servers, this includes the backend api_key and the current
+    consecutive failure count, so a check cycle needs no per-server lookups.
+    Results are never cached.
+    
+    Returns:
+        List of dictionaries with id, registration_id, endpoint_url,
+        api_key, health_status and consecutive_failures
+    """
+    try:
+        async with get_db_connection(named_rows=True) as connection:
+            cursor = await connection.execute(
+                """
+                SELECT id, registration_id, endpoint_url, api_key,
+                       health_status, consecutive_failures
+                FROM model_servers
+                WHERE is_active = 1
+                """
+            )
+            
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+    
+    except Exception as error:
+        logger.error(f"Failed to list servers for health check: {error}", exc_info=True)
+        raise
+
+
+# Health check failure: returns the new failure count. Shared by the
+# single-server and per-cycle updates so both reuse one cached statement.
+_MARK_UNHEALTHY_SQL = """
+    UPDATE model_servers
+    SET health_status = 'unhealthy',
+        consecutive_failures = consecutive_failures + 1,
+        last_checked_at = ?,
+        updated_at = ?
+    WHERE id = ?
+    RETURNING consecutive_failures
+"""
+
+
 async def update_health_status(
     server_id: int,
     is_healthy: bool,
     error_message: Optional[str] = None
-) -> None:
+) -> Optional[int]:
     """Update the health status of a server.
     
     Args:
         server_id: Database ID of the server
         is_healthy: Whether the server is healthy
         error_message: Optional error message if unhealthy
+    
+    Returns:
+        The server's consecutive failure count after the update, or None
+        if no server has that ID
     """
     timestamp = get_timestamp()
     
     try:
-        connection = await get_db_connection()
-        
-        try:
+        async with get_db_connection() as connection:
             if is_healthy:
                 # Server is healthy - reset consecutive failures
-                await connection.execute(
+                cursor = await connection.execute(
                     """
                     UPDATE model_servers
                     SET health_status = 'healthy',
@@ -473,32 +555,27 @@ async def update_health_status(
                         last_successful_request_at = ?,
                         updated_at = ?
                     WHERE id = ?
+                    RETURNING consecutive_failures
                     """,
                     (timestamp, timestamp, timestamp, server_id)
                 )
             else:
                 # Server is unhealthy - increment consecutive failures
-                await connection.execute(
-                    """
-                    UPDATE model_servers
-                    SET health_status = 'unhealthy',
-                        consecutive_failures = consecutive_failures + 1,
-                        last_checked_at = ?,
-                        updated_at = ?
-                    WHERE id = ?
-                    """,
+                cursor = await connection.execute(
+                    _MARK_UNHEALTHY_SQL,
                     (timestamp, timestamp, server_id)
                 )
             
+            # RETURNING rows must be read before the commit
+            row = await cursor.fetchone()
             await connection.commit()
+            invalidate_server_cache()
             
             logger.debug(
                 f"Updated health status for server {server_id}: "
                 f"{'healthy' if is_healthy else 'unhealthy'}"
             )
-        
-        finally:
-            await connection.close()
+            return row[0] if row else None
     
     except Exception as error:
         logger.error(
@@ -508,6 +585,72 @@ async def update_health_status(
         raise
 
 
+async def update_health_statuses(
+    healthy_ids: List[int],
+    unhealthy_ids: List[int]
+) -> Dict[int, int]:
+    """Record the results of a health check cycle in a single transaction.
+    
+    Applies the same updates as update_health_status for every server
+    with a single commit, instead of a commit per server.
+    
+    Args:
+        healthy_ids: Database IDs of servers that passed their check
+        unhealthy_ids: Database IDs of servers that failed their check
+    
+    Returns:
+        Mapping of each updated unhealthy server's ID to its new
+        consecutive failure count
+    """
+    if not healthy_ids and not unhealthy_ids:
+        return {}
+    
+    timestamp = get_timestamp()
+    failure_counts: Dict[int, int] = {}
+    
+    try:
+        async with get_db_connection() as connection:
+            if healthy_ids:
+                await connection.executemany(
+                    """
+                    UPDATE model_servers
+                    SET health_status = 'healthy',
+                        consecutive_failures = 0,
+                        last_checked_at = ?,
+                        last_successful_request_at = ?,
+                        updated_at = ?
+                    WHERE id = ?
+                    """,
+                    [(timestamp, timestamp, timestamp, server_id) for server_id in healthy_ids]
+                )
+            
+            # executemany cannot return rows, so run the constant single-row
+            # statement per server inside the same transaction. Its text never
+            # changes, so it stays in the statement cache, and the number of
+            # unhealthy servers is not limited by SQLITE_MAX_VARIABLE_NUMBER.
+            for server_id in unhealthy_ids:
+                cursor = await connection.execute(
+                    _MARK_UNHEALTHY_SQL,
+                    (timestamp, timestamp, server_id)
+                )
+                row = await cursor.fetchone()
+                if row is not None:
+                    failure_counts[server_id] = row[0]
+            
+            await connection.commit()
+            invalidate_server_cache()
+            
+            logger.debug(
+                f"Updated health status for {len(healthy_ids)} healthy and "
+                f"{len(unhealthy_ids)} unhealthy server(s)"
+            )
+            return failure_counts
+    
+    except Exception as error:
+        logger.error(f"Failed to update health statuses: {error}", exc_info=True)
+        raise
+
+
 async def get_server_count() -> int:
     """Get total count of active servers.
     
@@ -515,17 +658,12 @@ async def get_server_count() -> int:
         Number of active servers
     """
     try:
-        connection = await get_db_connection()
-        
-        try:
+        async with get_db_connection() as connection:
             cursor = await connection.execute(
                 "SELECT COUNT(*) FROM model_servers WHERE is_active = 1"
             )
             row = await cursor.fetchone()
             return row[0] if row else 0
-        
-        finally:
-            await connection.close()
     
     except Exception as error:
         logger.error(f"Failed to get server count: {error}", exc_info=True)
@@ -539,19 +677,101 @@ async def get_model_count() -> int:
         Number of distinct models
     """
     try:
-        connection = await get_db_connection()
-        
-        try:
+        async with get_db_connection() as connection:
             cursor = await connection.execute(
                 "SELECT COUNT(DISTINCT model_name) FROM model_servers WHERE is_active = 1"
             )
             row = await cursor.fetchone()
             return row[0] if row else 0
-        
-        finally:
-            await connection.close()
     
     except Exception as error:
         logger.error(f"Failed to get model count: {error}", exc_info=True)
         raise
 
+
+async def get_counts() -> Tuple[int, int]:
+    """Get the active server count and distinct model count in one query.
+    
+    Returns:
+        Tuple of (number of active servers, number of distinct models)
+    """
+    try:
+        async with get_db_connection() as connection:
+            cursor = await connection.execute(
+                """
+                SELECT COUNT(*), COUNT(DISTINCT model_name)
+                FROM model_servers
+                WHERE is_active = 1
+                """
+            )
+            row = await cursor.fetchone()
+            return (row[0], row[1]) if row else (0, 0)
+    
+    except Exception as error:
+        logger.error(f"Failed to get server and model counts: {error}", exc_info=True)
+        raise
+
+
+async def get_health_status_counts() -> Dict[str, int]:
+    """Get the number of active servers in each health status.
+    
+    Returns:
+        Dictionary mapping health status to server count. Statuses with
+        no servers are omitted.
+    """
+    try:
+        async with get_db_connection() as connection:
+            cursor = await connection.execute(
+                """
+                SELECT health_status, COUNT(*) FROM model_servers
+                WHERE is_active = 1
+                GROUP BY health_status
+                """
+            )
+            rows = await cursor.fetchall()
+            return {row[0]: row[1] for row in rows}
+    
+    except Exception as error:
+        logger.error(f"Failed to get health status counts: {error}", exc_info=True)
+        raise
+
+
+async def get_healthy_model_names() -> List[str]:
+    """Get the names of models that have at least one healthy, active server.
+    
+    Results are cached for MODELS_CACHE_TTL_SECONDS; health status changes
+    made through this module invalidate the cache.
+    
+    Returns:
+        Sorted list of distinct model names
+    """
+    global _healthy_models_cache
+    
+    expires_at, model_names = _healthy_models_cache
+    if expires_at > time.monotonic():
+        return list(model_names)
+    
+    try:
+        async with get_db_connection() as connection:
+            cursor = await connection.execute(
+                """
+                SELECT DISTINCT model_name
+                FROM model_servers
+                WHERE health_status = 'healthy'
+                    AND is_active = 1
+                ORDER BY model_name
+                """
+            )
+            rows = await cursor.fetchall()
+            model_names = [row[0] for row in rows]
+    
+    except Exception as error:
+        logger.error(f"Failed to get healthy model names: {error}", exc_info=True)
+        raise
+    
+    if settings.models_cache_ttl_seconds > 0:
+        _healthy_models_cache = (
+            time.monotonic() + settings.models_cache_ttl_seconds,
+            model_names
+        )
+    return list(model_names)
@@ -1,24 +1,50 @@
 """Router service for handling inference request routing and load balancing.
 
 This module implements the core routing logic for directing inference requests
-to healthy backend servers with round-robin load balancing and automatic failover.
+to healthy backend servers with round-robin (or least-outstanding) load
+balancing and automatic failover.
 Supports both regular and streaming responses.
 """
 
+import asyncio
 import time
 import httpx
-import json
-from typing import Optional, Dict, Any, Tuple, AsyncGenerator
-from threading import Lock
+import itertools
+import logging
+import orjson
+from typing import Optional, Dict, Any, List, Set, Tuple, AsyncGenerator
 
 from app.utils.logger import get_logger
 from app.utils.database import get_db_connection
 from app.utils.config import get_settings
+from app.services.registry import (
+    invalidate_server_cache,
+    get_server_cache_generation
+)
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
+def _only_server(healthy_servers: list, exclude: Optional[Set[int]]) -> Optional[dict]:
+    """Select from a single-server list without touching balancer state.
+
+    Most models are served by one backend, so this skips the counter and
+    candidate ordering entirely.
+
+    Args:
+        healthy_servers: List holding exactly one server dictionary
+        exclude: IDs of servers to skip
+
+    Returns:
+        The server, or None if it is excluded
+    """
+    server = healthy_servers[0]
+    if exclude and server['id'] in exclude:
+        return None
+    return server
+
+
 class RoundRobinLoadBalancer:
     """Round-robin load balancer for distributing requests across healthy servers.
 
@@ -28,105 +54,627 @@ class RoundRobinLoadBalancer:
 
     def __init__(self):
         """Initialize the load balancer with empty counters."""
-        self._counters: Dict[str, int] = {}
-        self._lock = Lock()
+        # next() on an itertools.count is atomic under the GIL, so no lock
+        # is needed around the per-model counters. Each model name is mapped
+        # once to a slot in the counter list.
+        self._model_slots: Dict[str, int] = {}
+        self._counters: List[itertools.count] = []
 
-    def select_server(self, model_name: str, healthy_servers: list) -> Optional[dict]:
+    def _next_index(self, model_name: str, server_count: int) -> int:
+        """Advance the model's round-robin counter.
+
+        Args:
+            model_name: Name of the model being requested
+            server_count: Number of servers to rotate over
+
+        Returns:
+            Index of the next server in round-robin order
+        """
+        slot = self._model_slots.get(model_name)
+        if slot is None:
+            slot = self._register_model(model_name)
+        return next(self._counters[slot]) % server_count
+
+    def _register_model(self, model_name: str) -> int:
+        """Allocate a counter slot for a model seen for the first time.
+
+        Args:
+            model_name: Name of the model
+
+        Returns:
+            Index of the model's counter in the counter list
+        """
+        # No await between the check and the insert, so two requests
+        # cannot both allocate a slot for the same model
+        slot = self._model_slots.get(model_name)
+        if slot is None:
+            self._counters.append(itertools.count())
+            slot = self._model_slots[model_name] = len(self._counters) - 1
+        return slot
+
+    def select_server(
+        self,
+        model_name: str,
+        healthy_servers: list,
+        exclude: Optional[Set[int]] = None
+    ) -> Optional[dict]:
         """Select a server using round-robin algorithm.
 
         Args:
             model_name: Name of the model being requested
             healthy_servers: List of healthy server dictionaries
+            exclude: IDs of servers to skip (e.g. ones that already failed)
 
         Returns:
             Selected server dictionary or None if no servers available
         """
         if not healthy_servers:
-            logger.warning(f"No healthy servers available for model: {model_name}")
+            logger.warning("No healthy servers available for model: %s", model_name)
             return None
 
-        with self._lock:
-            # Initialize counter for this model if it doesn't exist
-            if model_name not in self._counters:
-                self._counters[model_name] = 0
+        server_count = len(healthy_servers)
+        if server_count == 1:
+            return _only_server(healthy_servers, exclude)
+
+        index = self._next_index(model_name, server_count)
+        selected_server = healthy_servers[index]
+
+        if exclude:
+            # Walk forward from the round-robin position to the next
+            # server that has not been excluded
+            for _ in range(server_count):
+                if selected_server['id'] not in exclude:
+                    break
+                index = (index + 1) % server_count
+                selected_server = healthy_servers[index]
+            else:
+                return None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Round-robin selected server %s for model %s (index %d of %d)",
+                selected_server['registration_id'], model_name,
+                index, server_count
+            )
+
+        return selected_server
+
+    def request_started(self, server_id: int) -> None:
+        """Record that a request was sent to a server (no-op for round-robin).
+
+        Args:
+            server_id: Database ID of the server
+        """
+
+    def request_finished(self, server_id: int, elapsed_ms: float) -> None:
+        """Record that a request to a server completed (no-op for round-robin).
 
-            # Select server using round-robin
-            index = self._counters[model_name] % len(healthy_servers)
-            selected_server = healthy_servers[index]
+        Args:
+            server_id: Database ID of the server
+            elapsed_ms: Observed request latency in milliseconds
+        """
+
+    def request_cancelled(self, server_id: int) -> None:
+        """Record that a request ended without a latency sample (no-op for round-robin).
 
-            # Increment counter for next request
-            self._counters[model_name] = (self._counters[model_name] + 1) % len(healthy_servers)
+        Args:
+            server_id: Database ID of the server
+        """
 
+
+class LeastOutstandingLoadBalancer(RoundRobinLoadBalancer):
+    """Load balancer that prefers the server with the fewest in-flight requests.
+
+    Backend latency varies widely with sequence length, so plain round-robin
+    can queue requests behind one slow server while others sit idle. This
+    balancer tracks in-flight requests and an EWMA of observed latency per
+    server and picks the least loaded one, breaking ties by latency and then
+    by round-robin order.
+
+    Latencies within LATENCY_TIE_TOLERANCE of the fastest server count as a
+    tie, so servers of similar speed share an idle fleet's traffic evenly.
+    A server that loses on latency gets no new samples, so its EWMA is
+    ignored once it is older than LATENCY_STALE_SECONDS; the server then
+    competes as untested and is measured again.
+    """
+
+    # Weight of the newest latency sample in the moving average
+    EWMA_ALPHA = 0.2
+
+    # Relative latency difference treated as a tie (0.25 = within 25%)
+    LATENCY_TIE_TOLERANCE = 0.25
+
+    # Age after which a server's latency average is no longer trusted
+    LATENCY_STALE_SECONDS = 30.0
+
+    def __init__(self):
+        """Initialize the load balancer with empty counters and stats."""
+        super().__init__()
+        self._inflight: Dict[int, int] = {}
+        self._ewma_ms: Dict[int, float] = {}
+        self._sampled_at: Dict[int, float] = {}
+
+    def _latency_ms(self, server_id: int, now: float) -> Optional[float]:
+        """Get a server's latency average if it is recent enough to trust.
+
+        Args:
+            server_id: Database ID of the server
+            now: Current time.monotonic() value
+
+        Returns:
+            EWMA latency in milliseconds, or None if unknown or stale
+        """
+        sampled_at = self._sampled_at.get(server_id)
+        if sampled_at is None or now - sampled_at > self.LATENCY_STALE_SECONDS:
+            return None
+        return self._ewma_ms[server_id]
+
+    def select_server(
+        self,
+        model_name: str,
+        healthy_servers: list,
+        exclude: Optional[Set[int]] = None
+    ) -> Optional[dict]:
+        """Select the server with the fewest in-flight requests.
+
+        Args:
+            model_name: Name of the model being requested
+            healthy_servers: List of healthy server dictionaries
+            exclude: IDs of servers to skip (e.g. ones that already failed)
+
+        Returns:
+            Selected server dictionary or None if no servers available
+        """
+        if not healthy_servers:
+            logger.warning("No healthy servers available for model: %s", model_name)
+            return None
+
+        if len(healthy_servers) == 1:
+            return _only_server(healthy_servers, exclude)
+
+        # Rotate the starting point so ties are shared round-robin
+        start = self._next_index(model_name, len(healthy_servers))
+
+        candidates = healthy_servers[start:] + healthy_servers[:start]
+        if exclude:
+            candidates = [server for server in candidates if server['id'] not in exclude]
+            if not candidates:
+                return None
+
+        inflight = self._inflight
+        least = min(inflight.get(server['id'], 0) for server in candidates)
+        least_loaded = [
+            server for server in candidates
+            if inflight.get(server['id'], 0) == least
+        ]
+
+        if len(least_loaded) > 1:
+            # Keep every server within the tolerance of the fastest one.
+            # Servers with no recent samples stay in, so they get measured.
+            now = time.monotonic()
+            latencies = [self._latency_ms(server['id'], now) for server in least_loaded]
+            known = [latency for latency in latencies if latency is not None]
+            if known:
+                cutoff = min(known) * (1 + self.LATENCY_TIE_TOLERANCE)
+                least_loaded = [
+                    server for server, latency in zip(least_loaded, latencies)
+                    if latency is None or latency <= cutoff
+                ]
+
+        # Candidates are in rotated order, so ties go round-robin
+        selected_server = least_loaded[0]
+
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Round-robin selected server {selected_server['registration_id']} "
-                f"for model {model_name} (index {index} of {len(healthy_servers)})"
+                "Least-outstanding selected server %s for model %s "
+                "(in-flight %d, ewma %.0fms)",
+                selected_server['registration_id'], model_name,
+                least, self._ewma_ms.get(selected_server['id'], 0.0)
+            )
+
+        return selected_server
+
+    def request_started(self, server_id: int) -> None:
+        """Count a request as in flight to a server.
+
+        Args:
+            server_id: Database ID of the server
+        """
+        self._inflight[server_id] = self._inflight.get(server_id, 0) + 1
+
+    def request_finished(self, server_id: int, elapsed_ms: float) -> None:
+        """Release an in-flight request and fold its latency into the EWMA.
+
+        Args:
+            server_id: Database ID of the server
+            elapsed_ms: Observed request latency in milliseconds
+        """
+        self.request_cancelled(server_id)
+
+        now = time.monotonic()
+        previous = self._latency_ms(server_id, now)
+        if previous is None:
+            self._ewma_ms[server_id] = elapsed_ms
+        else:
+            self._ewma_ms[server_id] = (
+                (1 - self.EWMA_ALPHA) * previous + self.EWMA_ALPHA * elapsed_ms
             )
+        self._sampled_at[server_id] = now
+
+    def request_cancelled(self, server_id: int) -> None:
+        """Release an in-flight request without recording its latency.
+
+        Used for attempts whose duration is not a usable latency sample:
+        failures, streams, and attempts cancelled before they finished
+        (e.g. hedge losers).
 
-            return selected_server
+        Args:
+            server_id: Database ID of the server
+        """
+        remaining = self._inflight.get(server_id, 0) - 1
+        if remaining > 0:
+            self._inflight[server_id] = remaining
+        else:
+            self._inflight.pop(server_id, None)
 
 
 # Global load balancer instance
-_load_balancer = RoundRobinLoadBalancer()
+if settings.load_balancing_strategy == "round_robin":
+    _load_balancer = RoundRobinLoadBalancer()
+else:
+    _load_balancer = LeastOutstandingLoadBalancer()
 
+# Shared client for forwarding, so requests reuse pooled keep-alive
+# connections and concurrent requests to one backend can be multiplexed
+# over a single HTTP/2 connection instead of opening a socket per call
+_backend_client: Optional[httpx.AsyncClient] = None
 
-async def get_healthy_servers(model_name: str) -> list:
+
+def get_backend_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client used to forward requests to backends.
+
+    The client is normally created by init_backend_client() at startup, but
+    is created lazily here so forwarding also works outside the app
+    lifespan (scripts, tests).
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _backend_client
+    if _backend_client is None or _backend_client.is_closed:
+        _backend_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(settings.request_timeout_seconds, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=256,
+                max_connections=1024,
+                keepalive_expiry=60.0
+            )
+        )
+    return _backend_client
+
+
+async def init_backend_client() -> None:
+    """Create the shared backend HTTP client.
+
+    Called during application startup.
+    """
+    get_backend_client()
+    logger.info("Backend HTTP client initialized")
+
+
+async def close_backend_client() -> None:
+    """Close the shared backend HTTP client and its connections.
+
+    Called during application shutdown.
+    """
+    global _backend_client
+    if _backend_client is not None:
+        await _backend_client.aclose()
+        _backend_client = None
+        logger.info("Backend HTTP client closed")
+
+
+# Per-model cache of healthy servers, as (monotonic expiry time, registry
+# cache generation, servers). Entries are dropped whenever the registry
+# cache is invalidated, so health changes are seen immediately.
+_servers_cache: Dict[str, Tuple[float, int, list]] = {}
+
+# In-progress database lookups per model, as (registry cache generation,
+# task), so concurrent cache misses share a single query. The query runs in
+# its own task, so a cancelled caller does not cancel it for the others.
+_servers_inflight: Dict[str, Tuple[int, asyncio.Task]] = {}
+
+
+# Routing statements. Pooled connections are long-lived and sqlite3 caches
+# prepared statements per connection by SQL text, so keeping each statement
+# a single constant string lets every call reuse the compiled statement.
+_HEALTHY_SERVERS_SQL = """
+    SELECT id, registration_id, endpoint_url, api_key
+    FROM model_servers
+    WHERE model_name = ?
+        AND health_status = 'healthy'
+        AND is_active = 1
+    ORDER BY id
+"""
+
+_MARK_SUCCESS_NOW_SQL = """
+    UPDATE model_servers
+    SET last_successful_request_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+_MARK_SUCCESS_AT_SQL = """
+    UPDATE model_servers
+    SET last_successful_request_at = ?
+    WHERE id = ?
+"""
+
+_MARK_UNHEALTHY_SQL = """
+    UPDATE model_servers
+    SET
+        health_status = 'unhealthy',
+        consecutive_failures = consecutive_failures + 1,
+        last_checked_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+# Backend endpoints the gateway forwards to, used to precompute server URLs
+FORWARDED_ENDPOINTS = ("/v1/chat/completions", "/v1/completions")
+
+
+def _build_backend_headers(api_key: Optional[str]) -> Dict[str, str]:
+    """Build the headers sent with every request to a backend.
+
+    Args:
+        api_key: Backend server's API key, if configured
+
+    Returns:
+        Header dictionary with Content-Type and, if needed, Authorization
+    """
+    headers = {"Content-Type": "application/json"}
+    if api_key:
+        headers['Authorization'] = f"Bearer {api_key}"
+    return headers
+
+
+def _request_target(server: dict, endpoint: str) -> Tuple[str, Dict[str, str]]:
+    """Get the URL and headers for forwarding a request to a server.
+
+    Uses the values precomputed by _query_healthy_servers when available.
+
+    Args:
+        server: Server dictionary containing endpoint_url and api_key
+        endpoint: API endpoint path
+
+    Returns:
+        Tuple of (url, headers). The headers may be shared and must not
+        be mutated.
+    """
+    url = server.get('_urls', {}).get(endpoint)
+    if url is None:
+        url = f"{server['endpoint_url']}{endpoint}"
+    headers = server.get('_headers')
+    if headers is None:
+        headers = _build_backend_headers(server.get('api_key'))
+    return url, headers
+
+
+async def _query_healthy_servers(model_name: str) -> list:
     """Query the database for healthy servers hosting the specified model.
 
+    Only the columns routing needs are selected; admin views use the
+    registry's listing functions instead.
+
     Args:
         model_name: Name of the model to find servers for
 
     Returns:
-        List of server dictionaries with all server details
-    """
-    conn = await get_db_connection()
-
-    query = """
-        SELECT
-            id, registration_id, model_name, endpoint_url, api_key,
-            owner_name, owner_email, health_status, consecutive_failures,
-            last_checked_at, last_successful_request_at, is_active,
-            created_at, updated_at, description, tags
-        FROM model_servers
-        WHERE model_name = ?
-            AND health_status = 'healthy'
-            AND is_active = 1
-        ORDER BY last_successful_request_at ASC NULLS FIRST
+        List of server dictionaries with id, registration_id, endpoint_url
+        and api_key, plus precomputed request URLs and headers
     """
+    async with get_db_connection(named_rows=True) as conn:
+        cursor = await conn.execute(_HEALTHY_SERVERS_SQL, (model_name,))
+        rows = await cursor.fetchall()
+
+    # Convert Row objects to dictionaries, precomputing the per-server
+    # request URLs and headers so forwarding does not rebuild them
+    servers = []
+    for row in rows:
+        server = dict(row)
+        server['_urls'] = {
+            endpoint: f"{server['endpoint_url']}{endpoint}"
+            for endpoint in FORWARDED_ENDPOINTS
+        }
+        server['_headers'] = _build_backend_headers(server.get('api_key'))
+        servers.append(server)
+    return servers
 
-    cursor = await conn.execute(query, (model_name,))
-    rows = await cursor.fetchall()
 
-    await conn.close()
+async def _load_healthy_servers(model_name: str, generation: int) -> list:
+    """Query healthy servers for a model and cache the result.
 
-    # Convert Row objects to dictionaries
-    servers = [dict(row) for row in rows]
+    Args:
+        model_name: Name of the model to find servers for
+        generation: Registry cache generation when the lookup started
+
+    Returns:
+        List of server dictionaries
+    """
+    servers = await _query_healthy_servers(model_name)
+
+    # Only cache if nothing was invalidated while the query ran
+    if (servers and settings.server_list_cache_ttl_seconds > 0 and
+            generation == get_server_cache_generation()):
+        _servers_cache[model_name] = (
+            time.monotonic() + settings.server_list_cache_ttl_seconds,
+            generation,
+            servers
+        )
 
     logger.info(
-        f"Found {len(servers)} healthy server(s) for model '{model_name}'"
+        "Found %d healthy server(s) for model '%s'", len(servers), model_name
     )
 
     return servers
 
 
+def _healthy_servers_lookup_done(model_name: str, entry: Tuple[int, asyncio.Task]) -> None:
+    """Forget a finished lookup and retrieve its exception.
+
+    Args:
+        model_name: Model the lookup was for
+        entry: The (generation, task) entry registered for the lookup
+    """
+    if _servers_inflight.get(model_name) is entry:
+        del _servers_inflight[model_name]
+    task = entry[1]
+    if not task.cancelled():
+        # Mark the exception as retrieved in case every caller went away
+        task.exception()
+
+
+async def get_healthy_servers(model_name: str) -> list:
+    """Get healthy servers hosting the specified model.
+
+    Results are cached for SERVER_LIST_CACHE_TTL_SECONDS per model, and the
+    cache is dropped whenever the registry cache is invalidated (server
+    writes, health updates, mark_server_unhealthy). Concurrent misses for
+    the same model share one database query, which runs in its own task so
+    a cancelled caller cannot cancel it for the rest. Empty results are not
+    cached, so requests for unknown models cannot grow the cache. The
+    returned list is shared and must not be mutated.
+
+    Args:
+        model_name: Name of the model to find servers for
+
+    Returns:
+        List of server dictionaries with id, registration_id, endpoint_url
+        and api_key
+    """
+    generation = get_server_cache_generation()
+    cached = _servers_cache.get(model_name)
+    if (cached is not None and cached[1] == generation and
+            cached[0] > time.monotonic()):
+        return cached[2]
+
+    entry = _servers_inflight.get(model_name)
+    if entry is None or entry[0] != generation:
+        # No lookup running, or it started before the last invalidation
+        task = asyncio.create_task(_load_healthy_servers(model_name, generation))
+        entry = _servers_inflight[model_name] = (generation, task)
+        task.add_done_callback(
+            lambda _, entry=entry: _healthy_servers_lookup_done(model_name, entry)
+        )
+
+    return await asyncio.shield(entry[1])
+
+
 async def update_server_last_successful_request(server_id: int) -> None:
     """Update the last successful request timestamp for a server.
 
     Args:
         server_id: Database ID of the server
     """
-    conn = await get_db_connection()
+    async with get_db_connection() as conn:
+        await conn.execute(_MARK_SUCCESS_NOW_SQL, (server_id,))
 
-    await conn.execute(
-        """
-        UPDATE model_servers
-        SET last_successful_request_at = CURRENT_TIMESTAMP
-        WHERE id = ?
-        """,
-        (server_id,)
-    )
+        await conn.commit()
 
-    await conn.commit()
-    await conn.close()
+
+# Successful-request timestamps waiting to be written, keyed by server ID so
+# repeated successes collapse to the latest one
+_pending_successes: Dict[int, str] = {}
+_success_flusher_task: Optional[asyncio.Task] = None
+
+# Background mark_server_unhealthy writes, referenced until they finish
+_background_writes: Set[asyncio.Task] = set()
+
+# How often queued successful-request timestamps are written
+SUCCESS_FLUSH_INTERVAL_SECONDS = 0.1
+
+
+async def record_successful_request(server_id: int) -> None:
+    """Record a successful request to a server.
+
+    While the success flusher is running the timestamp is only queued, so
+    the response does not wait on a database commit; queued timestamps are
+    written in one transaction every SUCCESS_FLUSH_INTERVAL_SECONDS.
+    Without the flusher (scripts, tests) the write happens immediately.
+
+    Args:
+        server_id: Database ID of the server
+    """
+    if _success_flusher_task is None:
+        await update_server_last_successful_request(server_id)
+        return
+
+    # Same format as SQLite's CURRENT_TIMESTAMP
+    _pending_successes[server_id] = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+
+
+async def flush_successful_requests() -> None:
+    """Write all queued successful-request timestamps in one transaction."""
+    if not _pending_successes:
+        return
+
+    pending = list(_pending_successes.items())
+    _pending_successes.clear()
+
+    try:
+        async with get_db_connection() as conn:
+            await conn.executemany(
+                _MARK_SUCCESS_AT_SQL,
+                [(timestamp, server_id) for server_id, timestamp in pending]
+            )
+            await conn.commit()
+    except Exception as error:
+        logger.error(
+            "Failed to write %d successful-request timestamp(s): %s",
+            len(pending), error,
+            exc_info=True
+        )
+
+
+async def _success_flush_loop() -> None:
+    """Periodically write queued successful-request timestamps."""
+    while True:
+        await asyncio.sleep(SUCCESS_FLUSH_INTERVAL_SECONDS)
+        await flush_successful_requests()
+
+
+async def start_success_flusher() -> None:
+    """Start the background task that writes successful-request timestamps.
+
+    Called during application startup.
+    """
+    global _success_flusher_task
+    if _success_flusher_task is None:
+        _success_flusher_task = asyncio.create_task(_success_flush_loop())
+        logger.info("Successful-request flusher started")
+
+
+async def stop_success_flusher() -> None:
+    """Stop the flusher and finish all background bookkeeping writes.
+
+    Waits for pending server failure reports, then writes any timestamps
+    still queued. Called during application shutdown.
+    """
+    global _success_flusher_task
+    if _success_flusher_task is None:
+        return
+
+    _success_flusher_task.cancel()
+    try:
+        await _success_flusher_task
+    except asyncio.CancelledError:
+        pass
+    _success_flusher_task = None
+
+    if _background_writes:
+        await asyncio.gather(*_background_writes, return_exceptions=True)
+    await flush_successful_requests()
+    logger.info("Successful-request flusher stopped")
 
 
 async def mark_server_unhealthy(server_id: int, reason: str) -> None:
@@ -136,32 +684,59 @@ async def mark_server_unhealthy(server_id: int, reason: str) -> None:
         server_id: Database ID of the server
         reason: Reason why the server is being marked unhealthy
     """
-    conn = await get_db_connection()
+    async with get_db_connection() as conn:
+        await conn.execute(_MARK_UNHEALTHY_SQL, (server_id,))
 
-    await conn.execute(
-        """
-        UPDATE model_servers
-        SET
-            health_status = 'unhealthy',
-            consecutive_failures = consecutive_failures + 1,
-            last_checked_at = CURRENT_TIMESTAMP
-        WHERE id = ?
-        """,
-        (server_id,)
-    )
-
-    await conn.commit()
-    await conn.close()
+        await conn.commit()
+    invalidate_server_cache()
 
     logger.warning(
-        f"Marked server {server_id} as unhealthy. Reason: {reason}"
+        "Marked server %s as unhealthy. Reason: %s", server_id, reason
     )
 
 
+async def _mark_server_unhealthy_in_background(server_id: int, reason: str) -> None:
+    """Run mark_server_unhealthy, logging instead of raising on failure.
+
+    Args:
+        server_id: Database ID of the server
+        reason: Reason why the server is being marked unhealthy
+    """
+    try:
+        await mark_server_unhealthy(server_id, reason)
+    except Exception as error:
+        logger.error(
+            "Failed to mark server %s unhealthy: %s", server_id, error,
+            exc_info=True
+        )
+
+
+async def report_server_failure(server_id: int, reason: str) -> None:
+    """Mark a server unhealthy without holding up the caller.
+
+    While the success flusher is running, the write runs as a background
+    task so a retry (or the error response) can proceed immediately; the
+    task is not tied to the request, so a client disconnect cannot cancel
+    it, and shutdown waits for it. Without the flusher (scripts, tests)
+    the write happens inline.
+
+    Args:
+        server_id: Database ID of the server
+        reason: Reason why the server is being marked unhealthy
+    """
+    if _success_flusher_task is None:
+        await mark_server_unhealthy(server_id, reason)
+        return
+
+    task = asyncio.create_task(_mark_server_unhealthy_in_background(server_id, reason))
+    _background_writes.add(task)
+    task.add_done_callback(_background_writes.discard)
+
+
 async def forward_request(
     server: dict,
     endpoint: str,
-    request_data: dict,
+    request_body: bytes,
     timeout: int = 300
 ) -> Tuple[int, Dict[Any, Any], Optional[str]]:
     """Forward an inference request to a backend server.
@@ -169,7 +744,7 @@ async def forward_request(
     Args:
         server: Server dictionary containing endpoint_url and api_key
         endpoint: API endpoint path (e.g., '/v1/chat/completions')
-        request_data: Request body as dictionary
+        request_body: Raw JSON request body, forwarded unchanged
         timeout: Request timeout in seconds (default: 300)
 
     Returns:
@@ -178,72 +753,89 @@ async def forward_request(
     Raises:
         Exception: If request fails after all retries
     """
-    url = f"{server['endpoint_url']}{endpoint}"
-    headers = {}
-
-    # Add backend server's API key if configured
-    if server.get('api_key'):
-        headers['Authorization'] = f"Bearer {server['api_key']}"
+    url, headers = _request_target(server, endpoint)
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            logger.debug(f"Forwarding request to {url}")
+        logger.debug("Forwarding request to %s", url)
 
-            response = await client.post(
-                url,
-                json=request_data,
-                headers=headers
-            )
+        response = await get_backend_client().post(
+            url,
+            content=request_body,
+            headers=headers,
+            timeout=timeout
+        )
 
-            elapsed_ms = int((time.time() - start_time) * 1000)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
-            logger.info(
-                f"Backend server {server['registration_id']} responded: "
-                f"status={response.status_code}, latency={elapsed_ms}ms"
-            )
+        logger.info(
+            "Backend server %s responded: status=%d, latency=%dms",
+            server['registration_id'], response.status_code, elapsed_ms
+        )
 
-            # Parse response
-            try:
-                response_data = response.json()
-            except Exception:
-                response_data = {"text": response.text}
+        # Parse response
+        try:
+            response_data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            response_data = {"text": response.text}
 
-            return response.status_code, response_data, None
+        return response.status_code, response_data, None
 
     except httpx.TimeoutException as exc:
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         error_msg = f"Request timeout after {elapsed_ms}ms"
         logger.error(
-            f"Timeout forwarding request to {url}: {error_msg}"
+            "Timeout forwarding request to %s: %s", url, error_msg
         )
         return 504, {}, error_msg
 
     except httpx.RequestError as exc:
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         error_msg = f"Request error: {str(exc)}"
         logger.error(
-            f"Error forwarding request to {url}: {error_msg}"
+            "Error forwarding request to %s: %s", url, error_msg
         )
         return 503, {}, error_msg
 
     except Exception as exc:
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         error_msg = f"Unexpected error: {str(exc)}"
         logger.error(
-            f"Unexpected error forwarding request to {url}: {error_msg}",
+            "Unexpected error forwarding request to %s: %s", url, error_msg,
             exc_info=True
         )
         return 500, {}, error_msg
 
 
+# SSE events end with a blank line
+_SSE_EVENT_ENDINGS = (b"\n\n", b"\r\n\r\n")
+
+# Buffered stream bytes are sent once they reach this size even if no
+# event boundary has arrived
+STREAM_FLUSH_BYTES = 16384
+
+
+def _last_sse_event_end(buffer: bytearray) -> int:
+    """Find the end of the last complete SSE event in a buffer.
+
+    Args:
+        buffer: Bytes received from the backend but not yet sent
+
+    Returns:
+        Offset just past the last event terminator, or 0 if there is none
+    """
+    lf = buffer.rfind(b"\n\n")
+    crlf = buffer.rfind(b"\r\n\r\n")
+    return max(lf + 2 if lf != -1 else 0, crlf + 4 if crlf != -1 else 0)
+
+
 async def forward_streaming_request(
     server: dict,
     endpoint: str,
-    request_data: dict,
+    request_body: bytes,
     timeout: int = 300
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """Forward a streaming inference request to a backend server.
     
     This function handles Server-Sent Events (SSE) streaming by forwarding
@@ -252,86 +844,100 @@ async def forward_streaming_request(
     Args:
         server: Server dictionary containing endpoint_url and api_key
         endpoint: API endpoint path (e.g., '/v1/chat/completions')
-        request_data: Request body as dictionary
+        request_body: Raw JSON request body, forwarded unchanged
         timeout: Request timeout in seconds (default: 300)
         
     Yields:
-        SSE-formatted strings (data: {json}\\n\\n)
+        Raw SSE bytes (data: {json}\\n\\n) as received from the backend
         
     Raises:
         Exception: If streaming fails or connection is lost
     """
-    url = f"{server['endpoint_url']}{endpoint}"
-    headers = {}
+    url, headers = _request_target(server, endpoint)
     
-    # Add backend server's API key if configured
-    if server.get('api_key'):
-        headers['Authorization'] = f"Bearer {server['api_key']}"
-    
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     chunk_count = 0
     total_bytes = 0
     
     logger.info(
-        f"Starting streaming request to {server['registration_id']} at {url}",
+        "Starting streaming request to %s at %s", server['registration_id'], url,
         extra={"server_id": server['registration_id'], "endpoint": endpoint}
     )
     
+    _load_balancer.request_started(server['id'])
+    
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            async with client.stream(
-                'POST',
-                url,
-                json=request_data,
-                headers=headers
-            ) as response:
+        async with get_backend_client().stream(
+            'POST',
+            url,
+            content=request_body,
+            headers=headers,
+            timeout=timeout
+        ) as response:
+            
+            # Check if response status is OK
+            if response.status_code != 200:
+                elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                error_msg = f"Backend returned status {response.status_code}"
+                logger.error(
+                    "Streaming request to %s failed: status=%d, latency=%dms",
+                    server['registration_id'], response.status_code, elapsed_ms
+                )
                 
-                # Check if response status is OK
-                if response.status_code != 200:
-                    elapsed_ms = int((time.time() - start_time) * 1000)
-                    error_msg = f"Backend returned status {response.status_code}"
-                    logger.error(
-                        f"Streaming request to {server['registration_id']} failed: "
-                        f"status={response.status_code}, latency={elapsed_ms}ms"
-                    )
-                    
-                    # Try to read error response
-                    try:
-                        error_body = await response.aread()
-                        logger.error(f"Error body: {error_body.decode()}")
-                    except Exception:
-                        pass
-                    
-                    raise Exception(error_msg)
+                # Try to read error response
+                try:
+                    error_body = await response.aread()
+                    logger.error("Error body: %s", error_body.decode(errors='replace'))
+                except Exception:
+                    pass
                 
-                # Stream chunks from backend to client
-                async for chunk in response.aiter_bytes():
-                    if chunk:
-                        chunk_count += 1
-                        total_bytes += len(chunk)
-                        
-                        # Decode and yield the chunk
-                        decoded_chunk = chunk.decode('utf-8')
-                        yield decoded_chunk
+                raise Exception(error_msg)
+            
+            # Stream chunks from backend to client as whole SSE events. A read
+            # that ends mid-event is held until the rest arrives, and events
+            # arriving together go out as one write. Bytes are passed through
+            # as-is; decoding would cost a copy and could split a character.
+            pending = bytearray()
+            async for chunk in response.aiter_bytes():
+                if not chunk:
+                    continue
+                chunk_count += 1
+                total_bytes += len(chunk)
                 
-                elapsed_ms = int((time.time() - start_time) * 1000)
-                
-                logger.info(
-                    f"Streaming request to {server['registration_id']} completed: "
-                    f"chunks={chunk_count}, bytes={total_bytes}, latency={elapsed_ms}ms",
-                    extra={
-                        "server_id": server['registration_id'],
-                        "chunk_count": chunk_count,
-                        "total_bytes": total_bytes,
-                        "latency_ms": elapsed_ms
-                    }
-                )
+                if not pending and chunk.endswith(_SSE_EVENT_ENDINGS):
+                    yield chunk
+                    continue
                 
+                pending += chunk
+                event_end = _last_sse_event_end(pending)
+                if event_end:
+                    yield bytes(pending[:event_end])
+                    del pending[:event_end]
+                elif len(pending) >= STREAM_FLUSH_BYTES:
+                    yield bytes(pending)
+                    pending.clear()
+            
+            if pending:
+                yield bytes(pending)
+            
+            elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            
+            logger.info(
+                "Streaming request to %s completed: chunks=%d, bytes=%d, latency=%dms",
+                server['registration_id'], chunk_count, total_bytes, elapsed_ms,
+                extra={
+                    "server_id": server['registration_id'],
+                    "chunk_count": chunk_count,
+                    "total_bytes": total_bytes,
+                    "latency_ms": elapsed_ms
+                }
+            )
+            
     except httpx.TimeoutException as exc:
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         error_msg = f"Streaming timeout after {elapsed_ms}ms"
         logger.error(
-            f"Timeout during streaming request to {url}: {error_msg}",
+            "Timeout during streaming request to %s: %s", url, error_msg,
             extra={
                 "server_id": server['registration_id'],
                 "chunk_count": chunk_count,
@@ -341,10 +947,10 @@ async def forward_streaming_request(
         raise Exception(error_msg)
     
     except httpx.RequestError as exc:
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         error_msg = f"Request error: {str(exc)}"
         logger.error(
-            f"Error during streaming request to {url}: {error_msg}",
+            "Error during streaming request to %s: %s", url, error_msg,
             extra={
                 "server_id": server['registration_id'],
                 "chunk_count": chunk_count,
@@ -354,10 +960,10 @@ async def forward_streaming_request(
         raise Exception(error_msg)
     
     except Exception as exc:
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         error_msg = f"Unexpected error: {str(exc)}"
         logger.error(
-            f"Unexpected error during streaming request to {url}: {error_msg}",
+            "Unexpected error during streaming request to %s: %s", url, error_msg,
             exc_info=True,
             extra={
                 "server_id": server['registration_id'],
@@ -366,13 +972,19 @@ async def forward_streaming_request(
             }
         )
         raise Exception(error_msg)
+    
+    finally:
+        # A stream's duration is its whole generation time (and is cut short
+        # by client aborts), so it is not comparable with the non-streaming
+        # latencies the balancer averages; only release the in-flight slot
+        _load_balancer.request_cancelled(server['id'])
 
 
 async def handle_streaming_request(
     model_name: str,
     endpoint: str,
-    request_data: dict
-) -> Tuple[Optional[dict], Optional[AsyncGenerator[str, None]], Optional[str]]:
+    request_body: bytes
+) -> Tuple[Optional[dict], Optional[AsyncGenerator[bytes, None]], Optional[str]]:
     """Handle a streaming inference request with server selection.
     
     This function finds a healthy server, selects one using round-robin,
@@ -381,7 +993,7 @@ async def handle_streaming_request(
     Args:
         model_name: Name of the model being requested
         endpoint: API endpoint path
-        request_data: Request body as dictionary
+        request_body: Raw JSON request body
         
     Returns:
         Tuple of (selected_server_dict, streaming_generator, error_message)
@@ -389,25 +1001,25 @@ async def handle_streaming_request(
         If failed: (None, None, error_message)
     """
     logger.info(
-        f"Handling streaming {endpoint} request for model '{model_name}'"
+        "Handling streaming %s request for model '%s'", endpoint, model_name
     )
     
     # Get healthy servers
     healthy_servers = await get_healthy_servers(model_name)
     
     if not healthy_servers:
-        logger.error(f"No healthy servers available for model '{model_name}'")
+        logger.error("No healthy servers available for model '%s'", model_name)
         return None, None, "No healthy servers available for this model"
     
     # Select server using round-robin
     server = _load_balancer.select_server(model_name, healthy_servers)
     
     if not server:
-        logger.error(f"Failed to select server for model '{model_name}'")
+        logger.error("Failed to select server for model '%s'", model_name)
         return None, None, "Failed to select server"
     
     logger.info(
-        f"Selected server {server['registration_id']} for streaming request"
+        "Selected server %s for streaming request", server['registration_id']
     )
     
     try:
@@ -415,7 +1027,7 @@ async def handle_streaming_request(
         stream_generator = forward_streaming_request(
             server,
             endpoint,
-            request_data,
+            request_body,
             timeout=settings.request_timeout_seconds
         )
         
@@ -424,12 +1036,12 @@ async def handle_streaming_request(
     except Exception as exc:
         error_msg = str(exc)
         logger.error(
-            f"Failed to create streaming request: {error_msg}",
+            "Failed to create streaming request: %s", error_msg,
             exc_info=True
         )
         
         # Mark server as unhealthy
-        await mark_server_unhealthy(
+        await report_server_failure(
             server['id'],
             f"Streaming request failed: {error_msg}"
         )
@@ -437,10 +1049,157 @@ async def handle_streaming_request(
         return None, None, error_msg
 
 
+async def _attempt_request(
+    server: dict,
+    endpoint: str,
+    request_body: bytes
+) -> Tuple[int, Dict[Any, Any], Optional[str]]:
+    """Forward a request to one server, tracking it as in flight.
+
+    Args:
+        server: Server dictionary to send the request to
+        endpoint: API endpoint path
+        request_body: Raw JSON request body
+
+    Returns:
+        Tuple of (status_code, response_dict, error_message)
+    """
+    _load_balancer.request_started(server['id'])
+    attempt_start = time.monotonic()
+    result = None
+    try:
+        result = await forward_request(
+            server,
+            endpoint,
+            request_body,
+            timeout=settings.request_timeout_seconds
+        )
+        return result
+    finally:
+        # Only successful responses are latency samples. A refused
+        # connection or instant 5xx would make a broken server look fast,
+        # and a cancelled hedge loser only ran for part of its request.
+        if result is not None and result[0] == 200:
+            _load_balancer.request_finished(
+                server['id'],
+                (time.monotonic() - attempt_start) * 1000
+            )
+        else:
+            _load_balancer.request_cancelled(server['id'])
+
+
+async def _handle_hedged_request(
+    model_name: str,
+    endpoint: str,
+    request_body: bytes,
+    healthy_servers: list,
+    max_retries: int
+) -> Tuple[int, Dict[Any, Any], Optional[str], Optional[str]]:
+    """Route a request with hedging across servers.
+
+    The first attempt is sent immediately. If it has not answered within
+    HEDGE_DELAY_MS, another attempt is sent to a different server, and
+    the first successful response wins; the other attempts are cancelled.
+    A failed attempt marks its server unhealthy. If no other attempt is
+    still in flight, a replacement is sent straight away; otherwise the
+    remaining attempts keep running and the hedge timer decides whether to
+    send another. At most max_retries attempts are made in total.
+
+    Args:
+        model_name: Name of the model being requested
+        endpoint: API endpoint path
+        request_body: Raw JSON request body
+        healthy_servers: Candidate servers for the model
+        max_retries: Maximum number of attempts
+
+    Returns:
+        Tuple of (status_code, response_dict, error_message, server_id)
+    """
+    hedge_delay = settings.hedge_delay_ms / 1000
+    # Servers already tried or still in flight
+    used_ids: Set[int] = set()
+    in_flight: Dict[asyncio.Task, dict] = {}
+    attempts = 0
+    last_error = None
+
+    def launch() -> bool:
+        nonlocal attempts
+        if attempts >= max_retries or len(used_ids) >= len(healthy_servers):
+            return False
+        server = _load_balancer.select_server(
+            model_name, healthy_servers, exclude=used_ids
+        )
+        if not server:
+            return False
+        attempts += 1
+        used_ids.add(server['id'])
+        logger.info(
+            "Attempt %d/%d: Routing to server %s at %s",
+            attempts, max_retries,
+            server['registration_id'], server['endpoint_url']
+        )
+        task = asyncio.create_task(_attempt_request(server, endpoint, request_body))
+        in_flight[task] = server
+        return True
+
+    launch()
+    try:
+        while in_flight:
+            can_hedge = attempts < max_retries and len(used_ids) < len(healthy_servers)
+            done, _ = await asyncio.wait(
+                in_flight,
+                timeout=hedge_delay if can_hedge else None,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if not done:
+                # Slow response - hedge with another server
+                launch()
+                continue
+
+            for task in done:
+                server = in_flight.pop(task)
+                status_code, response_data, error_msg = task.result()
+
+                if status_code == 200:
+                    await record_successful_request(server['id'])
+                    logger.info(
+                        "Successfully routed request to server %s",
+                        server['registration_id']
+                    )
+                    return status_code, response_data, None, server['registration_id']
+
+                last_error = error_msg or f"Backend returned status {status_code}"
+                await report_server_failure(
+                    server['id'],
+                    f"Request failed: {last_error}"
+                )
+                logger.warning(
+                    "Request to server %s failed: %s",
+                    server['registration_id'], last_error
+                )
+
+            if not in_flight:
+                launch()
+    finally:
+        # Cancel the losing attempts
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    logger.error(
+        "All retry attempts exhausted for model '%s'. Last error: %s",
+        model_name, last_error
+    )
+
+    return 504, {}, f"All servers failed. Last error: {last_error}", None
+
+
 async def handle_request(
     model_name: str,
     endpoint: str,
-    request_data: dict,
+    request_body: bytes,
     max_retries: int = 2
 ) -> Tuple[int, Dict[Any, Any], Optional[str], Optional[str]]:
     """Handle an inference request with automatic failover.
@@ -452,82 +1211,93 @@ async def handle_request(
     4. If the request fails, mark server unhealthy and retry with another server
     5. Return response or error after all retries exhausted
 
+    With HEDGE_DELAY_MS set, slow attempts are hedged with a parallel
+    request to another server instead (see _handle_hedged_request).
+
     Args:
         model_name: Name of the model being requested
         endpoint: API endpoint path
-        request_data: Request body as dictionary
+        request_body: Raw JSON request body
         max_retries: Maximum number of retry attempts (default: 2)
 
     Returns:
         Tuple of (status_code, response_dict, error_message, server_id)
     """
     logger.info(
-        f"Handling {endpoint} request for model '{model_name}'"
+        "Handling %s request for model '%s'", endpoint, model_name
     )
 
     # Get healthy servers
     healthy_servers = await get_healthy_servers(model_name)
 
     if not healthy_servers:
-        logger.error(f"No healthy servers available for model '{model_name}'")
+        logger.error("No healthy servers available for model '%s'", model_name)
         return 503, {}, "No healthy servers available for this model", None
 
-    # Try up to max_retries servers
+    if settings.hedge_delay_ms > 0 and len(healthy_servers) > 1 and max_retries > 1:
+        return await _handle_hedged_request(
+            model_name, endpoint, request_body, healthy_servers, max_retries
+        )
+
+    # Try up to max_retries servers. Failed servers are excluded by ID rather
+    # than rebuilding the (shared, cached) server list after each failure.
     attempts = 0
     last_error = None
+    excluded_ids: Set[int] = set()
 
-    while attempts < max_retries and healthy_servers:
+    while attempts < max_retries and len(excluded_ids) < len(healthy_servers):
         attempts += 1
 
-        # Select server using round-robin
-        server = _load_balancer.select_server(model_name, healthy_servers)
+        # Select server using the configured load balancer
+        server = _load_balancer.select_server(
+            model_name, healthy_servers, exclude=excluded_ids
+        )
 
         if not server:
             break
 
         logger.info(
-            f"Attempt {attempts}/{max_retries}: Routing to server "
-            f"{server['registration_id']} at {server['endpoint_url']}"
+            "Attempt %d/%d: Routing to server %s at %s",
+            attempts, max_retries,
+            server['registration_id'], server['endpoint_url']
         )
 
-        # Forward request
-        status_code, response_data, error_msg = await forward_request(
-            server,
-            endpoint,
-            request_data,
-            timeout=settings.request_timeout_seconds
+        # Forward request, tracking it as in flight for load balancing
+        status_code, response_data, error_msg = await _attempt_request(
+            server, endpoint, request_body
         )
 
         # Check if request was successful
         if status_code == 200:
             # Update last successful request timestamp
-            await update_server_last_successful_request(server['id'])
+            await record_successful_request(server['id'])
 
             logger.info(
-                f"Successfully routed request to server {server['registration_id']}"
+                "Successfully routed request to server %s", server['registration_id']
             )
 
             return status_code, response_data, None, server['registration_id']
 
         # Request failed - mark server unhealthy and try next server
         last_error = error_msg or f"Backend returned status {status_code}"
-        await mark_server_unhealthy(
+        await report_server_failure(
             server['id'],
             f"Request failed: {last_error}"
         )
 
-        # Remove failed server from list
-        healthy_servers = [s for s in healthy_servers if s['id'] != server['id']]
+        # Exclude the failed server from the remaining attempts
+        excluded_ids.add(server['id'])
 
         logger.warning(
-            f"Request to server {server['registration_id']} failed: {last_error}. "
-            f"{len(healthy_servers)} server(s) remaining for retry."
+            "Request to server %s failed: %s. %d server(s) remaining for retry.",
+            server['registration_id'], last_error,
+            len(healthy_servers) - len(excluded_ids)
         )
 
     # All retries exhausted
     logger.error(
-        f"All retry attempts exhausted for model '{model_name}'. "
-        f"Last error: {last_error}"
+        "All retry attempts exhausted for model '%s'. Last error: %s",
+        model_name, last_error
     )
 
     return 504, {}, f"All servers failed. Last error: {last_error}", None
@@ -3,30 +3,106 @@
 This module provides functions and dependencies for API key and session-based authentication.
 """
 
-from typing import Annotated, Optional
+import functools
+import hmac
+import logging
+import time
+from typing import Annotated, Dict, Optional, Tuple
 from fastapi import Header, HTTPException, status, Request
 
-from app.utils.config import get_settings
+from app.utils.config import get_settings, hash_api_key
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
-# Import session auth (lazy import to avoid circular dependencies)
-_session_authenticator = None
+# Error payloads for authentication failures, built once and shared by
+# every HTTPException raised below
+_ERR_INVALID_ADMIN_KEY = {
+    "error": {
+        "message": "Invalid or missing admin API key",
+        "type": "authentication_error",
+        "code": "invalid_api_key"
+    }
+}
+_ERR_MISSING_CLIENT_KEY = {
+    "error": {
+        "message": "API key required",
+        "type": "authentication_error",
+        "code": "missing_api_key"
+    }
+}
+_ERR_INVALID_CLIENT_KEY = {
+    "error": {
+        "message": "Invalid API key",
+        "type": "authentication_error",
+        "code": "invalid_api_key"
+    }
+}
+_ERR_AUTH_REQUIRED = {
+    "error": {
+        "message": "Authentication required. Please log in or provide a valid admin API key.",
+        "type": "authentication_error",
+        "code": "authentication_required"
+    }
+}
 
+# Recently verified admin sessions, keyed by session cookie, as
+# (monotonic expiry time, auth info). Only successes are cached.
+_admin_session_cache: Dict[str, Tuple[float, dict]] = {}
+_ADMIN_SESSION_CACHE_MAX = 4096
 
+
+def _remember_admin_session(session_id: str, auth_info: dict) -> None:
+    """Cache a verified admin session for SESSION_AUTH_CACHE_TTL_SECONDS.
+    
+    Args:
+        session_id: Session cookie value
+        auth_info: Authentication info returned by verify_admin_auth
+    """
+    ttl = settings.session_auth_cache_ttl_seconds
+    if ttl <= 0:
+        return
+    
+    now = time.monotonic()
+    if len(_admin_session_cache) >= _ADMIN_SESSION_CACHE_MAX:
+        # Drop expired entries, then the oldest if still full
+        for key in [k for k, (expiry, _) in _admin_session_cache.items() if expiry <= now]:
+            del _admin_session_cache[key]
+        if len(_admin_session_cache) >= _ADMIN_SESSION_CACHE_MAX:
+            del _admin_session_cache[next(iter(_admin_session_cache))]
+    
+    _admin_session_cache[session_id] = (now + ttl, auth_info)
+
+
+def is_admin_api_key(api_key: Optional[str]) -> bool:
+    """Check an API key against the admin key in constant time.
+    
+    Args:
+        api_key: API key supplied by the caller
+    
+    Returns:
+        True if the key matches the configured admin API key
+    """
+    if not api_key:
+        return False
+    # Compare fixed-length digests so the cost does not depend on key length
+    return hmac.compare_digest(hash_api_key(api_key), settings.admin_api_key_digest)
+
+
+@functools.lru_cache(maxsize=1)
 def get_session_auth():
-    """Lazy load session authenticator."""
-    global _session_authenticator
-    if _session_authenticator is None:
-        try:
-            from app.utils.session_auth import get_session_authenticator
-            _session_authenticator = get_session_authenticator()
-        except Exception as error:
-            logger.warning(f"Session auth not available: {error}")
-            _session_authenticator = False  # Mark as unavailable
-    return _session_authenticator if _session_authenticator is not False else None
+    """Lazy load session authenticator.
+    
+    The session auth module is imported on first use to avoid circular
+    dependencies; the result, including unavailability, is cached.
+    """
+    try:
+        from app.utils.session_auth import get_session_authenticator
+        return get_session_authenticator()
+    except Exception as error:
+        logger.warning("Session auth not available: %s", error)
+        return None
 
 
 async def verify_admin_api_key(
@@ -51,20 +127,14 @@ async def verify_admin_api_key(
         async def list_servers():
             ...
     """
-    # Check if API key matches
-    if x_api_key != settings.admin_api_key:
+    # Check if API key matches (constant time, so timing does not leak the key)
+    if not is_admin_api_key(x_api_key):
         logger.warning(
-            f"Invalid admin API key attempt (key starts with: {x_api_key[:8]}...)"
+            "Invalid admin API key attempt (key starts with: %s...)", x_api_key[:8]
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail={
-                "error": {
-                    "message": "Invalid or missing admin API key",
-                    "type": "authentication_error",
-                    "code": "invalid_api_key"
-                }
-            }
+            detail=_ERR_INVALID_ADMIN_KEY
         )
     
     logger.debug("Admin API key verified successfully")
@@ -98,29 +168,17 @@ async def verify_client_api_key(
         logger.warning("Client API key required but not provided")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail={
-                "error": {
-                    "message": "API key required",
-                    "type": "authentication_error",
-                    "code": "missing_api_key"
-                }
-            }
+            detail=_ERR_MISSING_CLIENT_KEY
         )
     
     # Check if API key is in the list of valid client keys
-    if x_api_key not in settings.client_api_keys:
+    if hash_api_key(x_api_key) not in settings.client_api_key_digests:
         logger.warning(
-            f"Invalid client API key attempt (key starts with: {x_api_key[:8]}...)"
+            "Invalid client API key attempt (key starts with: %s...)", x_api_key[:8]
         )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail={
-                "error": {
-                    "message": "Invalid API key",
-                    "type": "authentication_error",
-                    "code": "invalid_api_key"
-                }
-            }
+            detail=_ERR_INVALID_CLIENT_KEY
         )
     
     logger.debug("Client API key verified successfully")
@@ -150,26 +208,32 @@ async def verify_admin_auth(
     # Try session-based authentication first
     session_auth = get_session_auth()
     if session_auth:
-        try:
-            is_admin = await session_auth.is_admin(request)
-            if is_admin:
-                # Get full user details
-                session_id = session_auth.get_session_cookie(request)
-                if session_id:
-                    session_data = await session_auth.validate_session(session_id)
-                    if session_data:
-                        user = await session_auth.get_user_from_session(session_data)
-                        if user:
-                            logger.debug(f"Admin authenticated via session: {user.get('email')}")
-                            return {
-                                'method': 'session',
-                                'user': user
-                            }
-        except Exception as error:
-            logger.debug(f"Session auth failed: {error}")
+        # Repeat requests from a recently verified admin skip the
+        # Firestore and Postgres lookups
+        session_id = session_auth.get_session_cookie(request)
+        if session_id:
+            cached = _admin_session_cache.get(session_id)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+            
+            try:
+                user = await session_auth.resolve_admin(session_id)
+                if user:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Admin authenticated via session: %s", user.get('email')
+                        )
+                    auth_info = {
+                        'method': 'session',
+                        'user': user
+                    }
+                    _remember_admin_session(session_id, auth_info)
+                    return auth_info
+            except Exception as error:
+                logger.debug("Session auth failed: %s", error)
     
     # Fall back to API key authentication
-    if x_api_key and x_api_key == settings.admin_api_key:
+    if is_admin_api_key(x_api_key):
         logger.debug("Admin authenticated via API key")
         return {
             'method': 'api_key',
@@ -178,18 +242,14 @@ async def verify_admin_auth(
     
     # Neither authentication method succeeded
     if x_api_key:
-        logger.warning(f"Invalid admin API key attempt (key starts with: {x_api_key[:8]}...)")
+        logger.warning(
+            "Invalid admin API key attempt (key starts with: %s...)", x_api_key[:8]
+        )
     else:
         logger.warning("Admin access attempt without valid session or API key")
     
     raise HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
-        detail={
-            "error": {
-                "message": "Authentication required. Please log in or provide a valid admin API key.",
-                "type": "authentication_error",
-                "code": "authentication_required"
-            }
-        }
+        detail=_ERR_AUTH_REQUIRED
     )
 
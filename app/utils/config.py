@@ -4,12 +4,26 @@ This module uses pydantic-settings to manage configuration from environment
 variables and .env files. All configuration is validated at startup.
 """
 
+import hashlib
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def hash_api_key(api_key: str) -> bytes:
+    """Hash an API key for comparison against the configured key digests.
+    
+    Args:
+        api_key: API key to hash
+    
+    Returns:
+        32-byte SHA-256 digest of the UTF-8 encoded key
+    """
+    return hashlib.sha256(api_key.encode("utf-8")).digest()
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables and .env file.
     
@@ -44,6 +58,10 @@ class Settings(BaseSettings):
         default=False,
         description="Enable auto-reload on code changes (development only)"
     )
+    workers: int = Field(
+        default=1,
+        description="Number of uvicorn worker processes (ignored when reload is enabled)"
+    )
     
     # Database settings
     database_url: str = Field(
@@ -54,6 +72,10 @@ class Settings(BaseSettings):
         default=True,
         description="Enable SQLite WAL mode for better concurrent access"
     )
+    database_pool_size: int = Field(
+        default=5,
+        description="Number of idle SQLite connections kept open for reuse"
+    )
     
     # Security settings
     admin_api_key: str = Field(
@@ -68,6 +90,11 @@ class Settings(BaseSettings):
         default_factory=list,
         description="List of valid client API keys (if required)"
     )
+    session_auth_cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="How long a verified admin session is trusted before it is re-checked "
+                    "(seconds, 0 disables)"
+    )
     
     # Logging settings
     log_level: str = Field(
@@ -116,6 +143,27 @@ class Settings(BaseSettings):
         default=True,
         description="Automatically deregister servers after max consecutive failures"
     )
+    health_check_concurrency: int = Field(
+        default=32,
+        description="Maximum number of server health checks run concurrently per cycle"
+    )
+    health_check_full_every_cycles: int = Field(
+        default=1,
+        description="When the active server set is unchanged and all servers were healthy, "
+                    "only probe every Nth cycle (1 = probe every cycle)"
+    )
+    health_cache_ttl_seconds: float = Field(
+        default=5.0,
+        description="How long the /health database probe result is cached (seconds)"
+    )
+    models_cache_ttl_seconds: float = Field(
+        default=5.0,
+        description="How long the /v1/models list of healthy model names is cached (seconds, 0 disables)"
+    )
+    server_list_cache_ttl_seconds: float = Field(
+        default=3.0,
+        description="How long list_servers results are cached in memory (seconds, 0 disables)"
+    )
     
     # Request routing settings
     request_timeout_seconds: int = Field(
@@ -126,10 +174,35 @@ class Settings(BaseSettings):
         default=2,
         description="Maximum number of retry attempts with different servers"
     )
+    hedge_delay_ms: float = Field(
+        default=0.0,
+        description="Send a parallel request to another server if the first has not "
+                    "answered within this many milliseconds (0 = disabled)"
+    )
     round_robin_enabled: bool = Field(
         default=True,
         description="Enable round-robin load balancing"
     )
+    load_balancing_strategy: str = Field(
+        default="round_robin",
+        description="Server selection strategy: 'round_robin' or 'least_outstanding'"
+    )
+    request_batching_enabled: bool = Field(
+        default=False,
+        description="Group concurrent non-streaming requests per model into micro-batches"
+    )
+    request_batch_max_size: int = Field(
+        default=8,
+        description="Maximum number of requests released together in one micro-batch"
+    )
+    request_batch_max_wait_ms: float = Field(
+        default=10.0,
+        description="How long the first request in a micro-batch waits for others (milliseconds)"
+    )
+    request_batch_min_size: int = Field(
+        default=1,
+        description="Micro-batch size at which a batch is released as soon as no other request is queued"
+    )
     
     # Rate limiting settings
     rate_limit_enabled: bool = Field(
@@ -212,6 +285,18 @@ class Settings(BaseSettings):
             raise ValueError("health_check_interval_seconds must be at least 10")
         return value
     
+    @field_validator("load_balancing_strategy")
+    @classmethod
+    def validate_load_balancing_strategy(cls, value: str) -> str:
+        """Validate that the load balancing strategy is supported."""
+        allowed_strategies = ["least_outstanding", "round_robin"]
+        value_lower = value.lower()
+        if value_lower not in allowed_strategies:
+            raise ValueError(
+                f"load_balancing_strategy must be one of {allowed_strategies}, got {value}"
+            )
+        return value_lower
+    
     # Model configuration
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -220,17 +305,47 @@ class Settings(BaseSettings):
         extra="ignore"  # Ignore extra fields in .env file
     )
     
+    @cached_property
+    def client_api_key_digests(self) -> frozenset[bytes]:
+        """SHA-256 digests of the valid client API keys.
+        
+        Lookups hash the supplied key and probe this set, so the cost does
+        not depend on key length or on which key matches.
+        
+        Returns:
+            Frozen set of client API key digests
+        """
+        return frozenset(hash_api_key(key) for key in self.client_api_keys)
+    
+    @cached_property
+    def admin_api_key_digest(self) -> bytes:
+        """SHA-256 digest of the admin API key, computed once.
+        
+        Returns:
+            32-byte digest of the admin API key
+        """
+        return hash_api_key(self.admin_api_key)
+    
+    @cached_property
+    def database_is_sqlite(self) -> bool:
+        """Whether database_url is a SQLite URL, parsed once."""
+        return self.database_url.startswith("sqlite")
+    
+    @cached_property
+    def database_path(self) -> Optional[Path]:
+        """SQLite database path parsed from database_url, parsed once."""
+        if self.database_is_sqlite:
+            # Extract path from URL
+            return Path(self.database_url.split("///")[-1])
+        return None
+    
     def get_database_path(self) -> Optional[Path]:
         """Get the path to the SQLite database file if using SQLite.
         
         Returns:
             Path to database file, or None if not using SQLite
         """
-        if self.database_url.startswith("sqlite"):
-            # Extract path from URL
-            db_path = self.database_url.split("///")[-1]
-            return Path(db_path)
-        return None
+        return self.database_path
     
     def is_sqlite(self) -> bool:
         """Check if database is SQLite.
@@ -238,40 +353,34 @@ class Settings(BaseSettings):
         Returns:
             True if using SQLite, False otherwise
         """
-        return self.database_url.startswith("sqlite")
-
-
-# Global settings instance
-# This will be initialized when the module is imported
-_settings: Optional[Settings] = None
+        return self.database_is_sqlite
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the global settings instance.
     
-    This function implements a singleton pattern for settings. The settings
-    are loaded once and cached for the lifetime of the application.
+    The settings are loaded on first call and cached for the lifetime of
+    the application.
     
     Returns:
         Settings instance
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
 
 
 def reload_settings() -> Settings:
     """Reload settings from environment and .env file.
     
     This is useful for testing or when configuration changes at runtime.
+    Modules that bound ``settings = get_settings()`` at import time keep
+    the instance they already have.
     
     Returns:
         New settings instance
     """
-    global _settings
-    _settings = Settings()
-    return _settings
+    get_settings.cache_clear()
+    return get_settings()
 
 
 if __name__ == "__main__":
@@ -8,9 +8,10 @@ This module handles:
 """
 
 import sqlite3
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, List, Optional
 import aiosqlite
 
 from app.utils.config import get_settings
@@ -66,6 +67,19 @@ MODEL_SERVERS_INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_is_active ON model_servers(is_active);",
     "CREATE INDEX IF NOT EXISTS idx_model_health ON model_servers(model_name, health_status, is_active);",
     "CREATE INDEX IF NOT EXISTS idx_registration_id ON model_servers(registration_id);",
+    # Covering index for the healthy model listing: answers the DISTINCT,
+    # ordered model_name query from the index alone, with no table lookups
+    "CREATE INDEX IF NOT EXISTS idx_health_active_model ON model_servers(health_status, is_active, model_name);",
+    # Server listing: active servers, newest first
+    "CREATE INDEX IF NOT EXISTS idx_servers_list ON model_servers(is_active, created_at DESC);",
+]
+
+
+# Indexes that are no longer created, dropped from existing databases.
+# idx_servers_routing indexed columns rewritten on every health cycle and
+# success flush without serving any query the router runs.
+RETIRED_MODEL_SERVERS_INDEXES = [
+    "DROP INDEX IF EXISTS idx_servers_routing;",
 ]
 
 
@@ -99,6 +113,12 @@ CREATE TABLE IF NOT EXISTS schema_version (
 );
 """
 
+CURRENT_SCHEMA_VERSION_SQL = (
+    "SELECT version FROM schema_version ORDER BY version DESC LIMIT 1"
+)
+
+RECORD_SCHEMA_VERSION_SQL = "INSERT INTO schema_version (version) VALUES (?)"
+
 
 async def init_database() -> None:
     """Initialize the database with the required schema.
@@ -135,17 +155,17 @@ async def init_database() -> None:
             if settings.database_wal_mode:
                 await connection.execute("PRAGMA journal_mode=WAL;")
                 logger.info("Enabled WAL mode for SQLite database")
+                await connection.execute("PRAGMA synchronous=NORMAL;")
             
             # Enable foreign keys
             await connection.execute("PRAGMA foreign_keys=ON;")
+            await connection.execute("PRAGMA temp_store=MEMORY;")
             
             # Create schema version table
             await connection.execute(SCHEMA_VERSION_TABLE)
             
             # Check current schema version
-            cursor = await connection.execute(
-                "SELECT version FROM schema_version ORDER BY version DESC LIMIT 1"
-            )
+            cursor = await connection.execute(CURRENT_SCHEMA_VERSION_SQL)
             row = await cursor.fetchone()
             current_version = row[0] if row else 0
             
@@ -159,21 +179,16 @@ async def init_database() -> None:
                 await connection.execute(MODEL_SERVERS_SCHEMA)
                 logger.info("Created model_servers table")
                 
-                # Create indexes
-                for index_sql in MODEL_SERVERS_INDEXES:
-                    await connection.execute(index_sql)
-                logger.info(f"Created {len(MODEL_SERVERS_INDEXES)} indexes on model_servers")
-                
                 # Optionally create health_checks table (for Phase 6)
                 # Uncomment when implementing historical health tracking
-                # await connection.execute(HEALTH_CHECKS_SCHEMA)
-                # for index_sql in HEALTH_CHECKS_INDEXES:
-                #     await connection.execute(index_sql)
+                # await connection.executescript(
+                #     "\n".join([HEALTH_CHECKS_SCHEMA, *HEALTH_CHECKS_INDEXES])
+                # )
                 # logger.info("Created health_checks table")
                 
                 # Update schema version
                 await connection.execute(
-                    "INSERT INTO schema_version (version) VALUES (?)",
+                    RECORD_SCHEMA_VERSION_SQL,
                     (SCHEMA_VERSION,)
                 )
                 
@@ -181,6 +196,14 @@ async def init_database() -> None:
                 logger.info(f"Database schema upgraded to version {SCHEMA_VERSION}")
             else:
                 logger.info(f"Database schema is up to date (version {current_version})")
+            
+            # Create indexes in one script. They are all IF NOT EXISTS, so
+            # this runs on every start and also adds indexes introduced
+            # (or drops ones retired) since an existing database was created.
+            await connection.executescript(
+                "\n".join(MODEL_SERVERS_INDEXES + RETIRED_MODEL_SERVERS_INDEXES)
+            )
+            logger.info(f"Ensured {len(MODEL_SERVERS_INDEXES)} indexes on model_servers")
         
         logger.info("Database initialization completed successfully")
         
@@ -189,31 +212,168 @@ async def init_database() -> None:
         raise
 
 
-async def get_db_connection() -> aiosqlite.Connection:
-    """Get an async database connection.
+# Compiled statements cached per pooled connection
+STATEMENT_CACHE_SIZE = 256
+
+
+class ConnectionPool:
+    """Pool of long-lived, pre-configured aiosqlite connections.
+    
+    Up to ``size`` idle connections are kept open for reuse. When every
+    pooled connection is checked out an extra connection is opened and
+    closed again on release, so callers never wait on the pool itself.
+    """
+    
+    def __init__(self, db_path: Path, size: int):
+        """Initialize an empty pool.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            size: Maximum number of idle connections to keep open
+        """
+        self._db_path = db_path
+        self._size = size
+        self._idle: List[aiosqlite.Connection] = []
+        self._closed = False
+    
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open and configure a new connection."""
+        settings = get_settings()
+        
+        # sqlite3 keeps compiled statements in a per-connection LRU keyed by
+        # SQL text, so long-lived pooled connections skip re-parsing the
+        # module-level query constants. Sized above the default of 128 to
+        # cover every distinct query the gateway issues.
+        connection = await aiosqlite.connect(
+            str(self._db_path),
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        
+        # Per-connection settings, applied once rather than on every checkout
+        await connection.execute("PRAGMA foreign_keys=ON;")
+        if settings.database_wal_mode:
+            # Safe with WAL: commits are durable once the WAL is checkpointed
+            await connection.execute("PRAGMA synchronous=NORMAL;")
+        await connection.execute("PRAGMA cache_size=-65536;")  # 64 MB
+        await connection.execute("PRAGMA temp_store=MEMORY;")
+        # Serve reads from a memory map instead of read() syscalls
+        await connection.execute("PRAGMA mmap_size=268435456;")  # 256 MB
+        
+        return connection
+    
+    async def acquire(self) -> aiosqlite.Connection:
+        """Check a connection out of the pool, opening one if none are idle.
+        
+        Returns:
+            Configured database connection
+        """
+        if self._idle:
+            return self._idle.pop()
+        return await self._connect()
+    
+    async def release(self, connection: aiosqlite.Connection) -> None:
+        """Return a connection to the pool.
+        
+        Any transaction left open by the caller is rolled back first. The
+        connection is closed instead if the pool is full or shut down.
+        
+        Args:
+            connection: Connection previously returned by acquire()
+        """
+        try:
+            if connection.in_transaction:
+                await connection.rollback()
+        except Exception as error:
+            logger.warning(f"Discarding database connection after rollback failed: {error}")
+            await connection.close()
+            return
+        
+        if self._closed or len(self._idle) >= self._size:
+            await connection.close()
+        else:
+            self._idle.append(connection)
+    
+    async def warm_up(self) -> None:
+        """Open connections until the pool holds ``size`` idle connections."""
+        while not self._closed and len(self._idle) < self._size:
+            self._idle.append(await self._connect())
+    
+    async def close(self) -> None:
+        """Close all idle connections and stop pooling released ones."""
+        self._closed = True
+        while self._idle:
+            await self._idle.pop().close()
+
+
+# Global connection pool, created on first use
+_pool: Optional[ConnectionPool] = None
+
+
+def _get_pool() -> ConnectionPool:
+    """Get the global connection pool, creating it if necessary.
     
     Returns:
-        Async database connection
+        ConnectionPool instance
     
     Raises:
-        Exception: If connection fails
+        ValueError: If the database is not SQLite or the path is unknown
     """
-    settings = get_settings()
+    global _pool
+    if _pool is None:
+        settings = get_settings()
+        
+        if not settings.is_sqlite():
+            raise ValueError("Only SQLite databases are currently supported")
+        
+        db_path = settings.get_database_path()
+        if db_path is None:
+            raise ValueError("Could not determine database path from settings")
+        
+        _pool = ConnectionPool(db_path, settings.database_pool_size)
+    return _pool
+
+
+async def open_database_pool() -> None:
+    """Create the connection pool and pre-open its connections.
     
-    if not settings.is_sqlite():
-        raise ValueError("Only SQLite databases are currently supported")
+    Called during application startup so the first requests do not pay
+    connection setup costs.
+    """
+    pool = _get_pool()
+    await pool.warm_up()
+    logger.info(f"Database connection pool ready ({pool._size} connections)")
+
+
+@asynccontextmanager
+async def get_db_connection(
+    named_rows: bool = False
+) -> AsyncIterator[aiosqlite.Connection]:
+    """Borrow a database connection from the pool.
     
-    db_path = settings.get_database_path()
-    if db_path is None:
-        raise ValueError("Could not determine database path from settings")
+    Rows are plain tuples by default. Pass ``named_rows=True`` only where
+    rows are read by column name (e.g. ``dict(row)``), since aiosqlite.Row
+    costs more to build per row.
+    
+    Usage:
+        async with get_db_connection() as connection:
+            await connection.execute(...)
     
-    connection = await aiosqlite.connect(str(db_path))
-    connection.row_factory = aiosqlite.Row  # Enable column access by name
+    Args:
+        named_rows: Return aiosqlite.Row objects instead of tuples
     
-    # Enable foreign keys
-    await connection.execute("PRAGMA foreign_keys=ON;")
+    Yields:
+        Async database connection, returned to the pool on exit
     
-    return connection
+    Raises:
+        Exception: If connection fails
+    """
+    pool = _get_pool()
+    connection = await pool.acquire()
+    connection.row_factory = aiosqlite.Row if named_rows else None
+    try:
+        yield connection
+    finally:
+        await pool.release(connection)
 
 
 async def close_database() -> None:
@@ -221,9 +381,11 @@ async def close_database() -> None:
     
     This is called during application shutdown.
     """
+    global _pool
     logger.info("Closing database connections")
-    # With aiosqlite, connections are typically managed per-request
-    # No global connection pool to close
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
     logger.info("Database connections closed")
 
 
@@ -231,9 +393,9 @@ def get_timestamp() -> str:
     """Get current timestamp in ISO format for database storage.
     
     Returns:
-        ISO format timestamp string
+        ISO format UTC timestamp string
     """
-    return datetime.utcnow().isoformat()
+    return datetime.now(timezone.utc).isoformat()
 
 
 async def health_check_database() -> bool:
@@ -243,12 +405,9 @@ async def health_check_database() -> bool:
         True if database is healthy, False otherwise
     """
     try:
-        connection = await get_db_connection()
-        try:
+        async with get_db_connection() as connection:
             await connection.execute("SELECT 1")
             return True
-        finally:
-            await connection.close()
     except Exception as error:
         logger.error(f"Database health check failed: {error}")
         return False
@@ -269,18 +428,18 @@ if __name__ == "__main__":
         await init_database()
         
         print("\nTesting database connection...")
-        connection = await get_db_connection()
-        cursor = await connection.execute(
-            "SELECT name FROM sqlite_master WHERE type='table'"
-        )
-        tables = await cursor.fetchall()
-        print(f"Tables in database: {[table[0] for table in tables]}")
-        await connection.close()
+        async with get_db_connection() as connection:
+            cursor = await connection.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            )
+            tables = await cursor.fetchall()
+            print(f"Tables in database: {[table[0] for table in tables]}")
         
         print("\nTesting database health check...")
         is_healthy = await health_check_database()
         print(f"Database healthy: {is_healthy}")
         
+        await close_database()
         print("\nTest completed successfully!")
     
     asyncio.run(test_db())
@@ -9,6 +9,7 @@ This module provides structured logging with:
 """
 
 import logging
+import re
 import sys
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
@@ -52,20 +53,30 @@ class SensitiveDataFilter(logging.Filter):
         "password", "secret", "token", "authorization"
     ]
     
+    # A sensitive key, an optional separator (and quote, for JSON-ish
+    # text), then the value that follows it, including a Bearer scheme
+    _SENSITIVE_VALUE_RE = re.compile(
+        r"\b("
+        + "|".join(
+            re.escape(pattern)
+            for pattern in sorted(SENSITIVE_PATTERNS, key=len, reverse=True)
+        )
+        + r")\b[\"']?\s*[:=]?\s*(?:bearer\s+)?\S+",
+        re.IGNORECASE
+    )
+    
     def filter(self, record: logging.LogRecord) -> bool:
-        """Redact sensitive data from log message."""
-        message = record.getMessage().lower()
+        """Redact sensitive data from log message.
         
-        # Check if any sensitive pattern is in the message
-        for pattern in self.SENSITIVE_PATTERNS:
-            if pattern in message:
-                # Replace the actual value with [REDACTED]
-                # This is a simple implementation; could be more sophisticated
-                record.msg = str(record.msg).replace(
-                    record.args[0] if record.args else "",
-                    "[REDACTED]"
-                )
-                record.args = ()
+        The message is formatted once and the value after each sensitive
+        key is replaced, so secrets are caught whichever argument they came
+        from. Redacted records carry the final text with no arguments.
+        """
+        message = record.getMessage()
+        redacted = self._SENSITIVE_VALUE_RE.sub(r"\1=[REDACTED]", message)
+        if redacted != message:
+            record.msg = redacted
+            record.args = ()
         
         return True
 
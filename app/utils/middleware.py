@@ -3,6 +3,7 @@
 This module contains middleware for:
 - Request body size limiting
 - Request ID generation and tracking
+- Response compression (excluding streaming responses)
 - Error handling improvements
 """
 
@@ -11,8 +12,10 @@ import time
 from typing import Callable
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.middleware.gzip import GZipResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.utils.logger import get_logger
 from app.utils.config import get_settings
@@ -114,3 +117,58 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         )
 
         return response
+
+
+class _StreamingAwareGZipResponder(GZipResponder):
+    """GZip responder that passes Server-Sent Events through uncompressed.
+
+    Compressing an SSE stream buffers events inside the gzip encoder, which
+    delays tokens reaching the client, so event streams are sent as-is.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, compresslevel: int = 9):
+        super().__init__(app, minimum_size, compresslevel=compresslevel)
+        self._passthrough = False
+
+    async def send_with_gzip(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            self._passthrough = content_type.startswith("text/event-stream")
+
+        if self._passthrough:
+            await self.send(message)
+        else:
+            await super().send_with_gzip(message)
+
+
+class StreamingAwareGZipMiddleware:
+    """Middleware that gzip-compresses responses larger than a minimum size.
+
+    Behaves like Starlette's GZipMiddleware but never compresses
+    text/event-stream responses, so streaming inference is unaffected.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, compresslevel: int = 6):
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application
+            minimum_size: Smallest response body in bytes worth compressing
+            compresslevel: gzip compression level (1-9)
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            if "gzip" in headers.get("Accept-Encoding", ""):
+                responder = _StreamingAwareGZipResponder(
+                    self.app,
+                    self.minimum_size,
+                    compresslevel=self.compresslevel
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
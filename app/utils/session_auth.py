@@ -146,32 +146,46 @@ class SessionAuthenticator:
             logger.error(f"Failed to get user from database: {error}", exc_info=True)
             return None
     
-    async def is_admin(self, request: Request) -> bool:
-        """Check if the current request is from an authenticated admin user.
+    async def resolve_admin(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Validate a session and return its user if they are an admin.
+        
+        Does the session lookup and user fetch once, so callers that need
+        both the admin check and the user details do not repeat them.
         
         Args:
-            request: FastAPI request object
+            session_id: Session ID from cookie
             
         Returns:
-            True if user is authenticated admin, False otherwise
+            User dict if the session belongs to an admin, None otherwise
         """
-        # Get session cookie
-        session_id = self.get_session_cookie(request)
-        if not session_id:
-            return False
-            
         # Validate session
         session_data = await self.validate_session(session_id)
         if not session_data:
-            return False
+            return None
             
         # Get user details
         user = await self.get_user_from_session(session_data)
         if not user:
-            return False
+            return None
             
         # Check admin status
-        return user.get('admin', False) is True
+        return user if user.get('admin', False) is True else None
+    
+    async def is_admin(self, request: Request) -> bool:
+        """Check if the current request is from an authenticated admin user.
+        
+        Args:
+            request: FastAPI request object
+            
+        Returns:
+            True if user is authenticated admin, False otherwise
+        """
+        # Get session cookie
+        session_id = self.get_session_cookie(request)
+        if not session_id:
+            return False
+            
+        return await self.resolve_admin(session_id) is not None
 
 
 # Global instance
@@ -5,7 +5,6 @@ preventing Server-Side Request Forgery (SSRF) attacks and other security issues.
 """
 
 import ipaddress
-import re
 from typing import Tuple
 from urllib.parse import urlparse
 
@@ -37,6 +36,14 @@ BLOCKED_HOSTNAMES = {
 }
 
 
+# Internal/local TLDs that should never be used for backend servers
+BLOCKED_TLDS = (".local", ".internal", ".lan", ".corp")
+
+
+# System ports commonly targeted by SSRF
+BLOCKED_PORTS = frozenset({22, 23, 25, 110, 143, 3306, 5432, 6379, 27017})
+
+
 def is_private_ip(ip_address: str) -> bool:
     """Check if an IP address is in a private range.
     
@@ -105,7 +112,8 @@ def validate_url(url: str) -> Tuple[bool, str]:
         return False, "URL must contain a valid hostname"
     
     # Check for blocked hostnames (case-insensitive)
-    if hostname.lower() in BLOCKED_HOSTNAMES:
+    hostname_lower = hostname.lower()
+    if hostname_lower in BLOCKED_HOSTNAMES:
         return False, f"URL hostname is blocked: {hostname}"
     
     # Check if hostname is an IP address
@@ -123,13 +131,12 @@ def validate_url(url: str) -> Tuple[bool, str]:
         # Check for suspicious patterns in domain name
         
         # Block internal/local TLDs
-        blocked_tlds = [".local", ".internal", ".lan", ".corp"]
-        for tld in blocked_tlds:
-            if hostname.lower().endswith(tld):
+        for tld in BLOCKED_TLDS:
+            if hostname_lower.endswith(tld):
                 return False, f"URL uses blocked TLD: {tld}"
         
         # Check for localhost variations
-        if "localhost" in hostname.lower():
+        if "localhost" in hostname_lower:
             return False, f"URL contains 'localhost' in hostname: {hostname}"
     
     # Additional security checks
@@ -139,12 +146,12 @@ def validate_url(url: str) -> Tuple[bool, str]:
         return False, "URL contains @ symbol, which is not allowed"
     
     # Check for suspicious ports (some commonly blocked)
-    if parsed.port:
+    port = parsed.port
+    if port:
         # Allow most ports, but block some system ports
-        blocked_ports = {22, 23, 25, 110, 143, 3306, 5432, 6379, 27017}
-        if parsed.port in blocked_ports:
-            logger.warning(f"URL uses potentially dangerous port: {parsed.port}")
-            return False, f"URL uses blocked port: {parsed.port}"
+        if port in BLOCKED_PORTS:
+            logger.warning(f"URL uses potentially dangerous port: {port}")
+            return False, f"URL uses blocked port: {port}"
     
     # URL passes all validation checks
     return True, ""
@@ -79,11 +79,16 @@ if [ "$RELOAD" = "true" ]; then
         --host "$HOST" \
         --port "$PORT" \
         --reload \
+        --loop uvloop \
+        --http httptools \
         --log-level "$(echo $LOG_LEVEL | tr '[:upper:]' '[:lower:]')"
 else
     echo "Running in production mode..."
     python -m uvicorn app.main:app \
         --host "$HOST" \
         --port "$PORT" \
+        --workers "${WORKERS:-1}" \
+        --loop uvloop \
+        --http httptools \
         --log-level "$(echo $LOG_LEVEL | tr '[:upper:]' '[:lower:]')"
 fi
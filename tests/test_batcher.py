@@ -0,0 +1,172 @@
+"""Unit tests for the request batching service.
+
+These tests verify:
+- Concurrent requests are released together
+- Batch timeout and early release behavior
+- Shutdown fails requests that were never forwarded
+- Requests abandoned while held in a batch are not forwarded
+- Idle dispatchers are stopped
+- Requests for models without healthy servers are not queued
+"""
+
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+# Set test environment variables before importing app modules
+os.environ["ADMIN_API_KEY"] = "test-admin-key-batcher-1234567890"
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///./test_batcher.db"
+os.environ["LOG_LEVEL"] = "DEBUG"
+
+from app.services import batcher
+from app.services.batcher import RequestBatcher, dispatch_request
+
+
+@pytest.fixture
+def forwarded(monkeypatch):
+    """Replace handle_request, recording the model of each forwarded request."""
+    calls = []
+
+    async def fake_handle_request(model_name, endpoint, request_body, max_retries=2):
+        calls.append(model_name)
+        return 200, {"body": request_body.decode()}, None, "server-1"
+
+    monkeypatch.setattr(batcher, "handle_request", fake_handle_request)
+    return calls
+
+
+class TestRequestBatcher:
+    """Test micro-batching of requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_released_together(self, forwarded):
+        """Test that requests are held until the batch fills, then all forwarded."""
+        request_batcher = RequestBatcher(max_batch_size=3, max_wait_ms=5000, min_batch_size=3)
+
+        first = [
+            asyncio.create_task(
+                request_batcher.submit("test-model", "/v1/completions", f"{i}".encode())
+            )
+            for i in range(2)
+        ]
+        await asyncio.sleep(0.05)
+        assert forwarded == []
+
+        last = asyncio.create_task(
+            request_batcher.submit("test-model", "/v1/completions", b"2")
+        )
+        results = await asyncio.wait_for(asyncio.gather(*first, last), 1)
+
+        assert [result[1]["body"] for result in results] == ["0", "1", "2"]
+        assert forwarded == ["test-model"] * 3
+        await request_batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_released_after_max_wait(self, forwarded):
+        """Test that a batch below min_batch_size is released after max_wait_ms."""
+        request_batcher = RequestBatcher(max_batch_size=8, max_wait_ms=100, min_batch_size=2)
+
+        start = time.monotonic()
+        status_code, _, _, _ = await request_batcher.submit(
+            "test-model", "/v1/completions", b"{}"
+        )
+
+        assert status_code == 200
+        assert time.monotonic() - start >= 0.09
+        await request_batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_lone_request_released_early(self, forwarded):
+        """Test that a lone request is not held for the full window."""
+        request_batcher = RequestBatcher(max_batch_size=8, max_wait_ms=5000)
+
+        status_code, _, _, _ = await asyncio.wait_for(
+            request_batcher.submit("test-model", "/v1/completions", b"{}"), 1
+        )
+
+        assert status_code == 200
+        await request_batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_close_fails_pending_requests(self, forwarded):
+        """Test that requests not yet forwarded fail when the batcher closes."""
+        request_batcher = RequestBatcher(max_batch_size=8, max_wait_ms=5000, min_batch_size=8)
+
+        pending = [
+            asyncio.create_task(
+                request_batcher.submit("test-model", "/v1/completions", b"{}")
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.05)
+
+        await request_batcher.close()
+
+        for task in pending:
+            with pytest.raises(RuntimeError, match="shut down"):
+                await asyncio.wait_for(task, 1)
+        assert forwarded == []
+
+    @pytest.mark.asyncio
+    async def test_abandoned_request_is_not_forwarded(self, forwarded):
+        """Test that a request whose caller went away during the window is dropped."""
+        request_batcher = RequestBatcher(max_batch_size=8, max_wait_ms=100, min_batch_size=8)
+
+        abandoned = asyncio.create_task(
+            request_batcher.submit("test-model", "/v1/completions", b"abandoned")
+        )
+        kept = asyncio.create_task(
+            request_batcher.submit("test-model", "/v1/completions", b"kept")
+        )
+        await asyncio.sleep(0.01)
+        abandoned.cancel()
+
+        _, response_data, _, _ = await asyncio.wait_for(kept, 1)
+
+        assert response_data == {"body": "kept"}
+        assert forwarded == ["test-model"]
+        await request_batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_dispatcher_is_stopped(self, forwarded):
+        """Test that a model's dispatcher exits after being idle."""
+        request_batcher = RequestBatcher(max_batch_size=8, max_wait_ms=10)
+        request_batcher.IDLE_TIMEOUT_SECONDS = 0.05
+
+        await request_batcher.submit("test-model", "/v1/completions", b"{}")
+        assert "test-model" in request_batcher._dispatchers
+
+        await asyncio.sleep(0.2)
+        assert request_batcher._dispatchers == {}
+        assert request_batcher._queues == {}
+
+        # A new request starts a fresh dispatcher
+        status_code, _, _, _ = await request_batcher.submit(
+            "test-model", "/v1/completions", b"{}"
+        )
+        assert status_code == 200
+        await request_batcher.close()
+
+
+class TestDispatchRequest:
+    """Test routing through dispatch_request with batching enabled."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_model_is_not_queued(self, forwarded, monkeypatch):
+        """Test that models without healthy servers are rejected up front."""
+        monkeypatch.setattr(batcher.settings, "request_batching_enabled", True)
+        monkeypatch.setattr(batcher, "get_healthy_servers", AsyncMock(return_value=[]))
+        monkeypatch.setattr(batcher, "_batcher", None)
+
+        status_code, _, error_msg, server_id = await dispatch_request(
+            "no-such-model", "/v1/completions", b"{}"
+        )
+
+        assert status_code == 503
+        assert "No healthy servers" in error_msg
+        assert server_id is None
+        assert batcher._batcher is None
+        assert forwarded == []
@@ -92,6 +92,10 @@ def setup_test_server(admin_headers):
         server_id = cursor.lastrowid
         conn.close()
 
+        # Rows were written behind the registry's back, so drop its caches
+        from app.services.registry import invalidate_server_cache
+        invalidate_server_cache()
+
         return {
             "id": server_id,
             "registration_id": unique_id,
@@ -0,0 +1,66 @@
+"""Unit tests for the logging utilities.
+
+These tests verify:
+- Sensitive values are redacted from plain and %-style log messages
+- Messages without sensitive data pass through unchanged
+"""
+
+import logging
+
+from app.utils.logger import SensitiveDataFilter
+
+
+def make_record(msg: str, *args) -> logging.LogRecord:
+    """Build a log record as logger.info(msg, *args) would."""
+    return logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg=msg,
+        args=args or None,
+        exc_info=None
+    )
+
+
+class TestSensitiveDataFilter:
+    """Test redaction of sensitive values in log records."""
+
+    def test_redacts_message_without_args(self):
+        """Test that the value after a sensitive key is redacted in a plain message."""
+        record = make_record("Connecting with api_key=sk-live-123 to backend")
+
+        assert SensitiveDataFilter().filter(record) is True
+
+        assert record.getMessage() == "Connecting with api_key=[REDACTED] to backend"
+
+    def test_redacts_secret_in_any_argument(self):
+        """Test that a secret in a later %-style argument is redacted, and others kept."""
+        record = make_record(
+            "Registered model %s for server %s with token %s",
+            "llama-3", "42", "tok-secret-value"
+        )
+
+        SensitiveDataFilter().filter(record)
+
+        message = record.getMessage()
+        assert "tok-secret-value" not in message
+        assert message == "Registered model llama-3 for server 42 with token=[REDACTED]"
+        assert record.args == ()
+
+    def test_redacts_bearer_authorization_header(self):
+        """Test that Bearer credentials are redacted along with the scheme."""
+        record = make_record("Headers: Authorization: %s", "Bearer abc.def.ghi")
+
+        SensitiveDataFilter().filter(record)
+
+        assert "abc.def.ghi" not in record.getMessage()
+
+    def test_leaves_other_messages_unchanged(self):
+        """Test that records without sensitive data keep their message and args."""
+        record = make_record("Routing %s with max_tokens=%d", "llama-3", 256)
+
+        SensitiveDataFilter().filter(record)
+
+        assert record.args == ("llama-3", 256)
+        assert record.getMessage() == "Routing llama-3 with max_tokens=256"
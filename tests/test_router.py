@@ -0,0 +1,313 @@
+"""Unit tests for the router service.
+
+These tests verify:
+- Least-outstanding server selection and tie-breaking
+- In-flight request accounting
+- Healthy-server caching and shared lookups
+- Hedged requests
+"""
+
+import asyncio
+import os
+from collections import Counter
+from unittest.mock import AsyncMock
+
+import pytest
+
+# Set test environment variables before importing app modules
+os.environ["ADMIN_API_KEY"] = "test-admin-key-router-1234567890"
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///./test_router.db"
+os.environ["LOG_LEVEL"] = "DEBUG"
+
+from app.services import router
+from app.services.registry import invalidate_server_cache
+from app.services.router import (
+    LeastOutstandingLoadBalancer,
+    get_healthy_servers,
+    handle_request
+)
+
+
+def make_servers(count: int) -> list:
+    """Build server dictionaries as returned by get_healthy_servers."""
+    return [
+        {
+            "id": server_id,
+            "registration_id": f"server-{server_id}",
+            "endpoint_url": f"https://server-{server_id}.example.com",
+            "api_key": None
+        }
+        for server_id in range(1, count + 1)
+    ]
+
+
+def run_sequential(balancer, servers: list, latencies: dict, requests: int) -> Counter:
+    """Send requests one at a time, reporting the given latency per server."""
+    selections = Counter()
+    for _ in range(requests):
+        server = balancer.select_server("test-model", servers)
+        selections[server["id"]] += 1
+        balancer.request_started(server["id"])
+        balancer.request_finished(server["id"], latencies[server["id"]])
+    return selections
+
+
+class TestLeastOutstandingLoadBalancer:
+    """Test least-outstanding server selection."""
+
+    def test_prefers_fewest_in_flight(self):
+        """Test that the server with the fewest in-flight requests is chosen."""
+        balancer = LeastOutstandingLoadBalancer()
+        servers = make_servers(3)
+        balancer.request_started(1)
+        balancer.request_started(1)
+        balancer.request_started(2)
+
+        for _ in range(5):
+            assert balancer.select_server("test-model", servers)["id"] == 3
+
+    def test_in_flight_accounting(self):
+        """Test that finished requests are released from the in-flight count."""
+        balancer = LeastOutstandingLoadBalancer()
+        balancer.request_started(1)
+        balancer.request_started(1)
+        assert balancer._inflight[1] == 2
+
+        balancer.request_finished(1, 100.0)
+        assert balancer._inflight[1] == 1
+
+        balancer.request_finished(1, 100.0)
+        assert 1 not in balancer._inflight
+
+    def test_idle_fleet_rotates_evenly(self):
+        """Test that servers of similar latency share sequential traffic."""
+        balancer = LeastOutstandingLoadBalancer()
+        servers = make_servers(3)
+
+        selections = run_sequential(
+            balancer, servers, {1: 100.0, 2: 105.0, 3: 110.0}, 300
+        )
+
+        assert selections == Counter({1: 100, 2: 100, 3: 100})
+
+    def test_avoids_much_slower_server(self):
+        """Test that a clearly slower server is skipped when load is equal."""
+        balancer = LeastOutstandingLoadBalancer()
+        servers = make_servers(2)
+
+        selections = run_sequential(balancer, servers, {1: 100.0, 2: 400.0}, 100)
+
+        assert selections[1] > 95
+
+    def test_stale_latency_is_remeasured(self):
+        """Test that a server starved by an old slow sample is tried again."""
+        balancer = LeastOutstandingLoadBalancer()
+        servers = make_servers(2)
+        balancer.request_started(2)
+        balancer.request_finished(2, 1000.0)
+        balancer.request_started(1)
+        balancer.request_finished(1, 100.0)
+
+        # Age server 2's sample past the staleness limit
+        balancer._sampled_at[2] -= balancer.LATENCY_STALE_SECONDS + 1
+
+        selected = {balancer.select_server("test-model", servers)["id"] for _ in range(2)}
+        assert selected == {1, 2}
+
+    def test_excluded_servers_are_skipped(self):
+        """Test that excluded servers are never selected."""
+        balancer = LeastOutstandingLoadBalancer()
+        servers = make_servers(3)
+
+        for _ in range(6):
+            server = balancer.select_server("test-model", servers, exclude={1, 2})
+            assert server["id"] == 3
+
+        assert balancer.select_server("test-model", servers, exclude={1, 2, 3}) is None
+
+    @pytest.mark.asyncio
+    async def test_failed_request_is_not_a_latency_sample(self, monkeypatch):
+        """Test that a server failing instantly does not win the next selection."""
+        servers = make_servers(2)
+        balancer = LeastOutstandingLoadBalancer()
+        balancer.request_started(2)
+        balancer.request_finished(2, 100.0)
+
+        async def fake_forward(server, endpoint, request_body, timeout=300):
+            return 503, {}, "Request error: connection refused"
+
+        monkeypatch.setattr(router, "_load_balancer", balancer)
+        monkeypatch.setattr(router, "get_healthy_servers", AsyncMock(return_value=servers))
+        monkeypatch.setattr(router, "forward_request", fake_forward)
+        monkeypatch.setattr(router, "report_server_failure", AsyncMock())
+
+        status_code, _, _, _ = await handle_request(
+            model_name="test-model",
+            endpoint="/v1/chat/completions",
+            request_body=b"{}",
+            max_retries=1
+        )
+
+        assert status_code == 504
+        assert balancer._inflight == {}
+        assert 1 not in balancer._ewma_ms
+        assert balancer.select_server("test-model", servers)["id"] == 2
+
+
+@pytest.fixture
+def clear_server_cache():
+    """Start each test with an empty healthy-server cache."""
+    router._servers_cache.clear()
+    yield
+    router._servers_cache.clear()
+
+
+class TestHealthyServerCache:
+    """Test get_healthy_servers caching and single-flight lookups."""
+
+    @pytest.mark.asyncio
+    async def test_results_cached_until_invalidated(self, clear_server_cache, monkeypatch):
+        """Test that lookups are cached and dropped on cache invalidation."""
+        servers = make_servers(2)
+        calls = []
+
+        async def fake_query(model_name):
+            calls.append(model_name)
+            return servers
+
+        monkeypatch.setattr(router, "_query_healthy_servers", fake_query)
+
+        assert await get_healthy_servers("test-model") == servers
+        assert await get_healthy_servers("test-model") == servers
+        assert len(calls) == 1
+
+        invalidate_server_cache()
+
+        assert await get_healthy_servers("test-model") == servers
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_query(self, clear_server_cache, monkeypatch):
+        """Test that concurrent cache misses for a model run a single query."""
+        servers = make_servers(1)
+        release = asyncio.Event()
+        calls = []
+
+        async def fake_query(model_name):
+            calls.append(model_name)
+            await release.wait()
+            return servers
+
+        monkeypatch.setattr(router, "_query_healthy_servers", fake_query)
+
+        lookups = [asyncio.create_task(get_healthy_servers("test-model")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*lookups) == [servers] * 5
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self, clear_server_cache, monkeypatch):
+        """Test that cancelling the first caller leaves waiting callers unaffected."""
+        servers = make_servers(1)
+        release = asyncio.Event()
+
+        async def fake_query(model_name):
+            await release.wait()
+            return servers
+
+        monkeypatch.setattr(router, "_query_healthy_servers", fake_query)
+
+        leader = asyncio.create_task(get_healthy_servers("test-model"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(get_healthy_servers("test-model"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == servers
+        assert not follower.cancelled()
+        assert leader.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_lookup_starts_new_query(
+        self, clear_server_cache, monkeypatch
+    ):
+        """Test that callers after an invalidation do not join a stale lookup."""
+        release = asyncio.Event()
+        results = iter([make_servers(2), make_servers(1)])
+
+        async def fake_query(model_name):
+            servers = next(results)
+            await release.wait()
+            return servers
+
+        monkeypatch.setattr(router, "_query_healthy_servers", fake_query)
+
+        stale = asyncio.create_task(get_healthy_servers("test-model"))
+        await asyncio.sleep(0)
+        invalidate_server_cache()
+        fresh = asyncio.create_task(get_healthy_servers("test-model"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert len(await stale) == 2
+        assert len(await fresh) == 1
+        # Only the lookup started after the invalidation is cached
+        assert await get_healthy_servers("test-model") == await fresh
+
+
+class TestHedgedRequests:
+    """Test request hedging across servers."""
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_slow_attempt_is_cancelled(self, monkeypatch):
+        """Test that a hedge to a fast server wins and the slow attempt is cancelled.
+
+        The cancelled attempt must release its in-flight slot without
+        recording its truncated latency.
+        """
+        servers = make_servers(2)
+        balancer = LeastOutstandingLoadBalancer()
+        slow_cancelled = asyncio.Event()
+
+        async def fake_forward(server, endpoint, request_body, timeout=300):
+            if server["id"] == 1:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    slow_cancelled.set()
+                    raise
+            return 200, {"server": server["registration_id"]}, None
+
+        monkeypatch.setattr(router.settings, "hedge_delay_ms", 10.0)
+        monkeypatch.setattr(router, "_load_balancer", balancer)
+        monkeypatch.setattr(router, "get_healthy_servers", AsyncMock(return_value=servers))
+        monkeypatch.setattr(router, "forward_request", fake_forward)
+        record_success = AsyncMock()
+        report_failure = AsyncMock()
+        monkeypatch.setattr(router, "record_successful_request", record_success)
+        monkeypatch.setattr(router, "report_server_failure", report_failure)
+
+        status_code, response_data, error_msg, server_id = await handle_request(
+            model_name="test-model",
+            endpoint="/v1/chat/completions",
+            request_body=b"{}",
+            max_retries=2
+        )
+
+        assert status_code == 200
+        assert server_id == "server-2"
+        assert response_data == {"server": "server-2"}
+        assert error_msg is None
+        assert slow_cancelled.is_set()
+        record_success.assert_awaited_once_with(2)
+        report_failure.assert_not_awaited()
+
+        # Both attempts released; only the completed one was measured
+        assert balancer._inflight == {}
+        assert 2 in balancer._ewma_ms
+        assert 1 not in balancer._ewma_ms
@@ -20,6 +20,7 @@ os.environ["HEALTH_CHECK_INTERVAL_SECONDS"] = "10"
 from app.main import app
 from app.utils.database import init_database, close_database, get_db_connection
 from app.services.registry import register_server
+from app.services.router import forward_streaming_request, STREAM_FLUSH_BYTES
 from app.utils.models import RegisterServerRequest
 
 
@@ -113,10 +114,10 @@ async def test_streaming_chat_completion_success(test_db, client, auth_headers):
     
     mock_response = MockStreamingResponse(mock_chunks)
     
-    with patch('httpx.AsyncClient') as mock_client_class:
+    with patch('app.services.router.get_backend_client') as mock_get_client:
         mock_client = AsyncMock()
         mock_client.stream = MagicMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
         
         # Make streaming request
         response = client.post(
@@ -178,10 +179,10 @@ async def test_streaming_completion_success(test_db, client, auth_headers):
     
     mock_response = MockStreamingResponse(mock_chunks)
     
-    with patch('httpx.AsyncClient') as mock_client_class:
+    with patch('app.services.router.get_backend_client') as mock_get_client:
         mock_client = AsyncMock()
         mock_client.stream = MagicMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
         
         # Make streaming request
         response = client.post(
@@ -251,10 +252,10 @@ async def test_streaming_backend_error(test_db, client, auth_headers):
     # Mock streaming response with error
     mock_response = MockStreamingResponse([], status_code=500)
     
-    with patch('httpx.AsyncClient') as mock_client_class:
+    with patch('app.services.router.get_backend_client') as mock_get_client:
         mock_client = AsyncMock()
         mock_client.stream = MagicMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
         
         # Make streaming request
         response = client.post(
@@ -313,13 +314,13 @@ async def test_non_streaming_still_works(test_db, client, auth_headers):
         }]
     }
     
-    with patch('httpx.AsyncClient') as mock_client_class:
+    with patch('app.services.router.get_backend_client') as mock_get_client:
         mock_client = AsyncMock()
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json.return_value = mock_response_data
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
         
         # Make non-streaming request
         response = client.post(
@@ -377,10 +378,10 @@ async def test_streaming_connection_drop(test_db, client, auth_headers):
     mock_response.__aenter__ = AsyncMock(return_value=mock_response)
     mock_response.__aexit__ = AsyncMock()
     
-    with patch('httpx.AsyncClient') as mock_client_class:
+    with patch('app.services.router.get_backend_client') as mock_get_client:
         mock_client = AsyncMock()
         mock_client.stream = MagicMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_get_client.return_value = mock_client
         
         # Make streaming request - should handle error gracefully
         response = client.post(
@@ -396,3 +397,91 @@ async def test_streaming_connection_drop(test_db, client, auth_headers):
         # The error happens during streaming, not before
         assert response.status_code == status.HTTP_200_OK
 
+
+async def collect_forwarded_chunks(chunks: list) -> list:
+    """Run forward_streaming_request against a mocked backend stream.
+    
+    Args:
+        chunks: Raw chunks the backend sends, as strings
+    
+    Returns:
+        List of byte chunks yielded to the client
+    """
+    server = {
+        "id": 1,
+        "registration_id": "sse-test-server",
+        "endpoint_url": "https://sse-test.example.com",
+        "api_key": None
+    }
+    
+    with patch('app.services.router.get_backend_client') as mock_get_client:
+        mock_client = AsyncMock()
+        mock_client.stream = MagicMock(return_value=MockStreamingResponse(chunks))
+        mock_get_client.return_value = mock_client
+        
+        return [
+            chunk async for chunk in forward_streaming_request(
+                server, "/v1/chat/completions", b"{}"
+            )
+        ]
+
+
+@pytest.mark.asyncio
+async def test_sse_events_split_across_chunks():
+    """Test that events split across backend reads are forwarded whole.
+    
+    Verifies:
+    - A read ending mid-event is held until the event completes
+    - Complete events arriving in one read go out together
+    """
+    chunks = [
+        'data: {"a":1}\n',
+        '\ndata: {"b"',
+        ':2}\n\ndata: {"c":3}\n\nda',
+        'ta: [DONE]\n\n'
+    ]
+    
+    forwarded = await collect_forwarded_chunks(chunks)
+    
+    assert forwarded == [
+        b'data: {"a":1}\n\n',
+        b'data: {"b":2}\n\ndata: {"c":3}\n\n',
+        b'data: [DONE]\n\n'
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sse_crlf_event_terminators():
+    """Test that \\r\\n\\r\\n event terminators are recognised."""
+    chunks = [
+        'data: {"a":1}\r\n\r\ndata: {"b":2}\r',
+        '\n\r\n'
+    ]
+    
+    forwarded = await collect_forwarded_chunks(chunks)
+    
+    assert forwarded == [
+        b'data: {"a":1}\r\n\r\n',
+        b'data: {"b":2}\r\n\r\n'
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sse_large_event_forced_flush():
+    """Test that buffered bytes are flushed at STREAM_FLUSH_BYTES without a boundary."""
+    large_event = 'data: ' + 'x' * STREAM_FLUSH_BYTES
+    chunks = [large_event[:100], large_event[100:], '\n\n']
+    
+    forwarded = await collect_forwarded_chunks(chunks)
+    
+    assert forwarded == [large_event.encode('utf-8'), b'\n\n']
+
+
+@pytest.mark.asyncio
+async def test_sse_trailing_partial_event():
+    """Test that a partial event left at end of stream is still forwarded."""
+    chunks = ['data: {"a":1}\n\n', 'data: {"b"', ':2}']
+    
+    forwarded = await collect_forwarded_chunks(chunks)
+    
+    assert forwarded == [b'data: {"a":1}\n\n', b'data: {"b":2}']